@@ -6,15 +6,31 @@
 ##############################################################################
 # REQUIRED IMPORTS
 ##############################################################################
+import concurrent.futures
 import datetime
-import glob
+import fnmatch
+import functools
 import os
-import re
 import time
 
 import numpy as np
 import pandas as pd
 
+# PyArrow is optional; when installed, its multi-threaded CSV reader and
+# native ISO-8601 timestamp parser are used to read the CAMPD archives.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Numba is optional; when installed, the month bitmask kernel is compiled.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 ##############################################################################
 # DOCUMENTATION
@@ -57,9 +73,77 @@ Last updated:
 """
 
 
+##############################################################################
+# GLOBALS
+##############################################################################
+# Known column types of the CAMPD archives (see the column naming scheme in
+# :func:`query_epa_cams`); declaring them skips type inference and keeps
+# both archives in :func:`fix` consistent (e.g., a column with no data in
+# one file, or unit IDs that are all numeric in one file). Integers are
+# nullable.
+CAMPD_DTYPES = {
+    'state': 'string',
+    'facility_name': 'string',
+    'unitId': 'string',
+    'associatedStacks': 'string',
+    'plant_id_eia': 'Int64',
+    'year': 'Int64',
+    'gross_load_mwh': 'float64',
+    'steam_load_1000_lbs': 'float64',
+    'so2_mass_tons': 'float64',
+    'co2_mass_tons': 'float64',
+    'nox_mass_tons': 'float64',
+    'heat_content_mmbtu': 'float64',
+}
+
+# The EPA CAMPD API key returned by ElectricityLCI's check_api; reused so
+# that repeated calls to :func:`query_epa_cams` (e.g., gap filling several
+# state-months) do not prompt for, or check, the key again.
+CAM_API_KEY = None
+
+
 ##############################################################################
 # FUNCTIONS
 ##############################################################################
+def analyze_dates(d_ser):
+    """Analyze a series of dates for number of lines and for data
+    representing a complete time series (i.e., at least one data point in
+    each month).
+
+    Parameters
+    ----------
+    d_ser : pandas.Series
+        A series of dates, either parsed or as strings (see
+        :func:`parse_months`).
+
+    Returns
+    -------
+    tuple
+        A tuple of length three:
+
+        - (int) The number of data lines in the series.
+        - (int) The number of missing months
+        - (list) The integer representation of months missing (e.g., [1, 2])
+    """
+    num_lines = len(d_ser)
+
+    # Pack the months into a bitmask (bit m is set for month m); a complete
+    # year has bits 1 through 12 set (i.e., 0x1FFE). Dates are parsed in
+    # chunks and the scan stops once every month is found. Archives list
+    # each facility's time series in order, so a complete file (the common
+    # case) is usually covered within the first chunk or two.
+    chunk_size = max(-(-num_lines // 8), 1)
+    mo_mask = 0
+    for i in range(0, num_lines, chunk_size):
+        mo_mask |= month_mask(parse_months(d_ser.iloc[i:i + chunk_size]))
+        if mo_mask == 0x1FFE:
+            return (num_lines, 0, [])
+
+    missed_mos = [x for x in range(1, 13) if not (mo_mask >> x) & 1]
+    num_missed = len(missed_mos)
+    return (num_lines, num_missed, missed_mos)
+
+
 def analyze_df(df):
     """Analyze a data frame for number of lines (excluding the header) and
     for data representing a complete time series (i.e., at least one data
@@ -83,31 +167,39 @@ def analyze_df(df):
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Method expects a DataFrame, not %s!" % type(df))
 
-    all_months = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-
-    num_lines = len(df)
     date_col = find_column(df, 'date')
     if date_col is None:
         # Use NoneType for line numbers to let :func:`run` know the date col
         # was not found; distinguish it from a file with zero lines.
-        return (None, 12, all_months)
+        return (None, 12, list(range(1, 13)))
+
+    return analyze_dates(df[date_col])
 
-    # Unique list of months in the data frame (e.g., 1, 2, 10, 12)
-    months = np.unique(
-        [extract_year_month(x)[1] for x in df[date_col].values]
-    )
 
-    # Run two checks on list of months
-    num_months = len(months)
-    sum_months = months.sum()
-    if num_months == 12 and sum_months == 78:
-        return (num_lines, 0, [])
-    elif num_months != 12:
-        missed_mos = [x for x in all_months if x not in months]
-        num_missed = len(missed_mos)
-        return (num_lines, num_missed, missed_mos)
+def analyze_file(csv_path):
+    """Read and analyze a single EPA CAMPD CSV archive.
 
+    Parameters
+    ----------
+    csv_path : str
+        A file path to an EPA CAMPD CSV archive.
 
+    Returns
+    -------
+    tuple
+        A tuple of length four: the file name followed by the three values
+        returned by :func:`analyze_df`.
+    """
+    f_name = os.path.basename(csv_path)
+    my_data = read_archive(csv_path, date_only=True)
+    date_col = find_column(my_data, 'date')
+    if date_col is None:
+        # Header only; let :func:`analyze_df` report the missing date column.
+        return (f_name, *analyze_df(my_data))
+    return (f_name, *analyze_dates(my_data[date_col]))
+
+
+@functools.lru_cache(maxsize=32)
 def build_glob(data_dir, year=None, freq=None):
     """Helper method to create a glob string.
 
@@ -125,6 +217,10 @@ def build_glob(data_dir, year=None, freq=None):
     str
         A glob string based on the criteria provided.
 
+    Notes
+    -----
+    Results are memoized, so arguments must be hashable.
+
     Examples
     --------
     >>> build_glob("data", 2016, 'hourly') # all 2016 hourly CSV files
@@ -138,29 +234,88 @@ def build_glob(data_dir, year=None, freq=None):
     my_glob = os.path.join(data_dir, "epacems*.csv")
     # Parameter-based globs:
     if year is not None and freq is not None:
-        my_glob = os.path.join(data_dir, "epacems_%s_%d*csv" % (freq, year))
+        my_glob = os.path.join(data_dir, f"epacems_{freq}_{year:d}*csv")
     elif year is not None and freq is None:
-        my_glob = os.path.join(data_dir, "epacems_*_%d*csv" % year)
+        my_glob = os.path.join(data_dir, f"epacems_*_{year:d}*csv")
     elif year is None and freq is not None:
-        my_glob = os.path.join(data_dir, "epacems_%s_*csv" % freq)
+        my_glob = os.path.join(data_dir, f"epacems_{freq}_*csv")
 
     return my_glob
 
 
+def column_index(df):
+    """Helper method to map lowercase column names to a data frame's columns.
+
+    Resolves several columns in one pass over ``df.columns``, rather than
+    one :func:`find_column` scan each. As in :func:`find_column`, names
+    that match more than one column (ignoring case) map to None.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A data frame.
+
+    Returns
+    -------
+    dict
+        Lowercase column names (keys) and column names (values).
+    """
+    col_idx = {}
+    for x in df.columns:
+        x_low = x.lower()
+        col_idx[x_low] = None if x_low in col_idx else x
+
+    return col_idx
+
+
+def count_lines(csv_path):
+    """Count the data lines (excluding the header) in a CSV file.
+
+    Reads the raw bytes in 1 MB blocks and counts newlines, which avoids
+    parsing the file when only line totals are needed.
+
+    Parameters
+    ----------
+    csv_path : str
+        A file path to a CSV file.
+
+    Returns
+    -------
+    int
+        The number of lines, not counting the header line.
+    """
+    num_lines = 0
+    last_chunk = b""
+    with open(csv_path, 'rb', buffering=0) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            num_lines += chunk.count(b"\n")
+            last_chunk = chunk
+
+    # Count a final line that lacks a trailing newline.
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        num_lines += 1
+
+    return max(num_lines - 1, 0)
+
+
 def extract_year_month(d_str):
-    """Helper method to extract year (int) and month (int) from a string."""
+    """Helper method to extract year (int) and month (int) from a string.
+
+    Both accepted formats (e.g., '2016-01-31T00:00:00+00' and '2016-01-31')
+    are fixed-width ISO strings starting with 'YYYY-MM-', so the year and
+    month are sliced directly rather than parsed with ``strptime``.
+    """
     try:
-        d_obj = datetime.datetime.strptime(d_str,  "%Y-%m-%dT%H:%M:%S+00")
-    except (ValueError, TypeError):
-        # Provide additional utility with a secondary check
-        try:
-            d_obj = datetime.datetime.strptime(d_str,  "%Y-%m-%d")
-        except (ValueError, TypeError):
+        if d_str[4] != "-" or d_str[7] != "-":
             return (None, None)
-        else:
-            return (d_obj.year, d_obj.month)
-    else:
-        return (d_obj.year, d_obj.month)
+        d_year = int(d_str[0:4])
+        d_month = int(d_str[5:7])
+    except (IndexError, ValueError, TypeError):
+        return (None, None)
+
+    if not 1 <= d_month <= 12:
+        return (None, None)
+    return (d_year, d_month)
 
 
 def find_column(df, col_name):
@@ -212,24 +367,26 @@ def find_duplicate_archives(data_dir, duplicate_str):
         duplicate string and the file path with the duplicate string.
     """
     # Get all files
-    all_files = glob.glob(build_glob(data_dir))
+    all_files = list_archives(data_dir)
+    all_files_set = set(all_files)
 
-    # Create the regular expression for searching file names
-    p = re.compile(".*%s.*" % duplicate_str, re.IGNORECASE)
+    # Case-insensitive search string for file names; a plain substring test
+    # needs no regular expression machinery.
+    dup_needle = duplicate_str.lower()
 
     # Find those marked with duplicate string
     dup_files = []
     for my_file in all_files:
         basename = os.path.basename(my_file)
-        dir_name = os.path.dirname(my_file)
-        if p.match(basename):
+        if dup_needle in basename.lower():
             # Now, turn the duplicated files into their original file names by
-            # removing the duplicate string.
+            # removing the duplicate string. Reuse the directory prefix of the
+            # listed path so it matches the entries in ``all_files_set``.
             orig_file = basename.replace(duplicate_str, "")
-            orig_file = os.path.join(dir_name, orig_file)
+            orig_file = my_file[:-len(basename)] + orig_file
 
             # Check that this original file exists
-            if orig_file in all_files:
+            if orig_file in all_files_set:
                 # If yes, add the two files as a tuple to the list
                 dup_files.append((orig_file, my_file))
             else:
@@ -260,8 +417,8 @@ def fix(data_dir, dup_str):
         # NOTE: the duplicate has the original file name (latest API run) and
         # the original has the dup string (i.e., the archive).
         dup_file, orig_file  = dup_pair
-        orig_df = pd.read_csv(orig_file)
-        dup_df = pd.read_csv(dup_file)
+        orig_df = read_archive(orig_file)
+        dup_df = read_archive(dup_file)
         print("Correcting %s" % os.path.basename(dup_file))
 
         # Pull stats from our two files
@@ -278,32 +435,68 @@ def fix(data_dir, dup_str):
         # file. You could confirm this as a measure of confidence.
         # I'm choosing to skip the existence check, since this method assumes
         # you already ran :func:`run` without errors.
-        date_col = find_column(orig_df, 'date')
+        col_idx = column_index(orig_df)
+        date_col = col_idx.get('date')
 
-        hr_col = find_column(orig_df, 'hour')
-        fac_col = find_column(orig_df, 'facility_name')
+        hr_col = col_idx.get('hour')
+        fac_col = col_idx.get('facility_name')
+        st_col = col_idx.get('state')
 
-        # Sort order is each facility's time series
-        sort_cols = []
-        if fac_col:
-            sort_cols.append(fac_col)
-        if date_col:
-            sort_cols.append(date_col)
-        if hr_col:
-            # Add the hourly column for sorting hourly data
-            sort_cols.append(hr_col)
+        # Sort order is each facility's time series (the hourly column is
+        # only found in hourly data)
+        sort_cols = [x for x in (fac_col, date_col, hr_col) if x]
 
         # Choose to overwrite ``orig_df`` as a memory-saving device; rather than
         # create yet another variable in memory. The downside is if we need to
         # reference the original again.
-        orig_df = pd.concat([orig_df, dup_df], ignore_index=True)
+        if pa is not None:
+            # Arrow-backed frames (see :func:`read_archive`) are concatenated
+            # without copying.
+            try:
+                orig_df = pa.concat_tables(
+                    [
+                        pa.Table.from_pandas(orig_df, preserve_index=False),
+                        pa.Table.from_pandas(dup_df, preserve_index=False),
+                    ],
+                    promote_options='default'
+                ).to_pandas(types_mapper=pd.ArrowDtype)
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                # A column not in CAMPD_DTYPES was inferred with different
+                # types in the two archives (e.g., numbers and strings);
+                # pandas merges it as objects, which are made strings so
+                # that Arrow can still sort and write the result.
+                orig_df = pd.concat([orig_df, dup_df], ignore_index=True)
+                for col in orig_df.columns[orig_df.dtypes == object]:
+                    orig_df[col] = orig_df[col].astype('string')
+        else:
+            orig_df = pd.concat([orig_df, dup_df], ignore_index=True)
+
+            # Facility and state names repeat for every record; as categories,
+            # hashing (duplicates) and sorting work on integer codes instead
+            # of strings. Category order is lexical, so the row order is
+            # unchanged. Converted after the concat, since concatenating
+            # categoricals with different categories falls back to objects.
+            for cat_col in (fac_col, st_col):
+                if cat_col:
+                    orig_df[cat_col] = orig_df[cat_col].astype('category')
+
+        # Remove duplicates before sorting, so there are fewer rows to sort.
+        orig_df = orig_df.drop_duplicates(ignore_index=True)
 
         # The ISO string format for dates means lexicographic sorting is also
         # chronologic. Yay!
-        orig_df = orig_df.sort_values(by=sort_cols, ascending=True)
+        if pa is not None and sort_cols:
+            orig_df = pa.Table.from_pandas(
+                orig_df, preserve_index=False
+            ).sort_by(
+                [(x, 'ascending') for x in sort_cols]
+            ).to_pandas(types_mapper=pd.ArrowDtype)
+        elif sort_cols:
+            # Each file is already in order; a stable merge sort is quick on
+            # the two appended runs.
+            orig_df = orig_df.sort_values(
+                by=sort_cols, ascending=True, kind='mergesort')
 
-        # Remove duplicates after sorting
-        orig_df = orig_df.drop_duplicates()
         f_lines, f_miss, f_months = analyze_df(orig_df)
 
         # Compute percent missing months reduced and percent data lines
@@ -322,7 +515,146 @@ def fix(data_dir, dup_str):
         # the duplicate string, 'ABCD', in it). Save the fixed data frame to the
         # original file name.
         print("Overwriting %s" % dup_file)
-        orig_df.to_csv(dup_file, index=False)
+        # Use pandas' writer (not Arrow's, which quotes every string value)
+        # so the rewritten archive keeps the original CSV format; write in
+        # blocks of rows to cap the formatted-string buffer.
+        orig_df.to_csv(dup_file, index=False, chunksize=100000)
+
+
+def list_archives(data_dir, year=None, freq=None):
+    """List the EPA CAMPD CSV archives in a directory.
+
+    A single :func:`os.scandir` pass over the directory, matching file names
+    against the pattern from :func:`build_glob`. Equivalent to
+    ``glob.glob(build_glob(data_dir, year, freq))``, but without globbing the
+    directory path itself.
+
+    Parameters
+    ----------
+    data_dir : str
+        A directory path where the EPA CAMPD archive CSV files are located.
+    year : int, optional
+        The year to search for, by default None
+    freq : str, optional
+        A choice between 'hourly', 'daily' and None (i.e., both), by default None
+
+    Returns
+    -------
+    list
+        A list of file paths (empty if the directory does not exist).
+    """
+    if not os.path.isdir(data_dir):
+        return []
+
+    f_pattern = os.path.basename(build_glob(data_dir, year, freq))
+    with os.scandir(data_dir) as it:
+        return [
+            x.path for x in it
+            if fnmatch.fnmatch(x.name, f_pattern) and x.is_file()
+        ]
+
+
+def month_mask(months):
+    """Helper method to pack an array of months (1--12) into a bitmask.
+
+    Bit m is set for each month m found, such that a complete year is
+    0x1FFE. The loop is compiled with Numba when it is installed (the
+    compiled kernel is cached on disk and reused across files).
+
+    Parameters
+    ----------
+    months : numpy.ndarray
+        An integer array of months.
+
+    Returns
+    -------
+    int
+        The month bitmask.
+    """
+    if len(months) == 0:
+        return 0
+    if _month_mask_jit is not None:
+        return int(_month_mask_jit(np.ascontiguousarray(months, np.uint8)))
+    return int(np.bitwise_or.reduce(1 << months.astype(np.uint16)))
+
+
+def _month_mask_loop(months):
+    # Numba kernel for :func:`month_mask`; avoid datetime types in here.
+    mask = 0
+    for i in range(months.size):
+        mask |= 1 << months[i]
+    return mask
+
+
+_month_mask_jit = None if njit is None else njit(cache=True)(_month_mask_loop)
+
+
+def parse_months(d_ser):
+    """Helper method to get the month (int) of each date in a series.
+
+    Handles dates already parsed when read (see :func:`read_archive`) and
+    date strings in the two formats accepted by :func:`extract_year_month`.
+
+    Parameters
+    ----------
+    d_ser : pandas.Series
+        A series of dates.
+
+    Returns
+    -------
+    numpy.ndarray
+        The months of the dates; unparsable dates are dropped.
+    """
+    if pa is not None and isinstance(d_ser.dtype, pd.ArrowDtype) and (
+            pa.types.is_timestamp(d_ser.dtype.pyarrow_dtype)
+            or pa.types.is_date(d_ser.dtype.pyarrow_dtype)):
+        # Dates were parsed by PyArrow's CSV reader; extract the months
+        # without leaving Arrow memory.
+        months = pc.month(pa.array(d_ser)).drop_null()
+        return months.to_numpy(zero_copy_only=False)
+
+    if pd.api.types.is_datetime64_any_dtype(d_ser):
+        # Dates were already parsed when the CSV was read.
+        return d_ser.dt.month.dropna().to_numpy()
+
+    # Both accepted formats start with 'YYYY-MM-', so slice the month out of
+    # the strings (vectorized) rather than parsing full timestamps or
+    # iterating over a Python object array; the same checks as
+    # :func:`extract_year_month` apply.
+    if not pd.api.types.is_string_dtype(d_ser):
+        d_ser = d_ser.astype(str)
+    d_year = pd.to_numeric(d_ser.str.slice(0, 4), errors='coerce')
+    d_month = pd.to_numeric(d_ser.str.slice(5, 7), errors='coerce')
+    d_ok = (
+        (d_ser.str.slice(4, 5) == "-")
+        & (d_ser.str.slice(7, 8) == "-")
+        & d_year.between(0, 9999)
+        & d_month.between(1, 12)
+    ).fillna(False)
+
+    return d_month[d_ok].to_numpy(dtype=np.int8)
+
+
+def prefetch_file(csv_path):
+    """Ask the operating system to start reading a file into its page cache.
+
+    The read-ahead happens asynchronously in the kernel, so the disk can be
+    busy with the next file while the current one is being processed.
+    Does nothing on platforms without ``os.posix_fadvise`` (e.g., Windows).
+
+    Parameters
+    ----------
+    csv_path : str
+        A file path.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return None
+
+    fd = os.open(csv_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
 
 
 # NEW
@@ -386,9 +718,15 @@ def query_epa_cams(year,
     # API max retries parameter
     max_tries = 4
 
-    # Check that the user provided a valid API key
-    cam_api = "https://www.epa.gov/power-sector/cam-api-portal#/api-key-signup"
-    api_key = check_api(api_key, "EPA", cam_api)
+    # Check that the user provided a valid API key (once per session)
+    global CAM_API_KEY
+    if CAM_API_KEY is not None and api_key in ("", CAM_API_KEY):
+        api_key = CAM_API_KEY
+    else:
+        cam_api = (
+            "https://www.epa.gov/power-sector/cam-api-portal#/api-key-signup")
+        api_key = check_api(api_key, "EPA", cam_api)
+        CAM_API_KEY = api_key
 
     # Check that the user selects a valid period
     valid_cams_periods = ['hourly', 'daily']
@@ -433,8 +771,9 @@ def query_epa_cams(year,
     start_date = datetime.date(year, month, 1)
     end_date = next_month(start_date) - datetime.timedelta(days=1)
 
-    # Prepare the empty data frame
-    df = pd.DataFrame(columns=list(c_map.values()))
+    # Collect each page's records; build a single data frame after the last
+    # page rather than one frame per page (and concatenating them).
+    js_recs = []
 
     # Initialize variables to start the API query for all records.
     recs_received = 0
@@ -481,24 +820,17 @@ def query_epa_cams(year,
         recs_total = int(recs_total)
         recs_received += len(js_list)
 
-        tmp_df = pd.DataFrame.from_dict(js_list).rename(columns=c_map)
-
         # HOTFIX: it may be valid for a month to have no data.
         # only skip if API fails
         # If no data or API failed, stop the query (incomplete data)
-        if len(tmp_df) == 0 and url_tries < max_tries:
+        if len(js_list) == 0 and url_tries < max_tries:
             print("No data for this query (page=%d)!" % page_no)
-        elif len(tmp_df) == 0 and url_tries >= max_tries:
+        elif len(js_list) == 0 and url_tries >= max_tries:
             print("Failed to retrieve data for %s %s (page=%d)!" % (
                 state, year, page_no)
             )
-        elif len(df) == 0 and len(tmp_df) > 0:
-            # First time, set df
-            df = tmp_df.copy()
         else:
-            # We've been here before. We're going in circles, Sam!
-            # NOTE: columns with all NaNs will raise a FutureWarning
-            df = pd.concat([df, tmp_df], ignore_index=True)
+            js_recs.extend(js_list)
 
         # Communicate where we are.
         print(
@@ -510,11 +842,23 @@ def query_epa_cams(year,
         # Increment page to continue
         page_no += 1
 
+    if js_recs:
+        df = pd.DataFrame.from_records(js_recs).rename(columns=c_map)
+    else:
+        df = pd.DataFrame(columns=list(c_map.values()))
+
     # NOTE: decision here is to save only the rows that have data.
     # Rows with NaN values in all data columns are dropped.
     # If you favor a more complete time series (with data gaps), then
     # comment this line out.
-    df = df.dropna(subset=data_cols, how='all')
+    # Columns that were entirely None arrive as objects; cast those to float
+    # so the check for data is a single vectorized NaN test.
+    df = df.astype({
+        x: 'float64' for x in data_cols
+        if not pd.api.types.is_numeric_dtype(df[x])
+    })
+    has_data = ~np.isnan(df[data_cols].to_numpy(dtype='float64')).all(axis=1)
+    df = df[has_data]
 
     # Write to electricitylci's output folder.
     if len(df) > 0 and to_save:
@@ -529,16 +873,90 @@ def query_epa_cams(year,
     return df
 
 
-def run(data_dir, year=None, freq=None):
+def read_archive(csv_path, date_only=False):
+    """Read an EPA CAMPD CSV archive.
+
+    Uses PyArrow's multi-threaded CSV reader when PyArrow is installed.
+
+    Parameters
+    ----------
+    csv_path : str
+        A file path to an EPA CAMPD CSV archive.
+    date_only : bool, optional
+        Whether to read (and parse) only the date column, by default False.
+        If the date column is not found, a header-only data frame is returned.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The CSV data. When reading all columns, the date column is kept as
+        strings so that it is written back to CSV unchanged.
+    """
+    # Peek at the header to resolve the date column's name.
+    df = pd.read_csv(csv_path, nrows=0)
+    date_col = find_column(df, 'date')
+    if date_only and date_col is None:
+        return df
+
+    # Column types for full reads; columns not in the file are ignored.
+    c_types = dict(CAMPD_DTYPES)
+    if date_col is not None:
+        c_types[date_col] = 'string'
+
+    if pa is not None:
+        if date_only:
+            # Arrow infers ISO-8601 timestamps natively while tokenizing.
+            c_opts = pa_csv.ConvertOptions(include_columns=[date_col])
+        else:
+            c_opts = pa_csv.ConvertOptions(column_types={
+                k: pa.string() if v == 'string'
+                else pa.from_numpy_dtype(np.dtype(v.lower()))
+                for k, v in c_types.items()
+            })
+        table = pa_csv.read_csv(csv_path, convert_options=c_opts)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    if date_only:
+        # Only the date column is needed for line counts and month coverage,
+        # so skip the (many) data columns and parse dates while tokenizing.
+        return pd.read_csv(
+            csv_path,
+            usecols=[date_col],
+            parse_dates=[date_col],
+            date_format='ISO8601'
+        )
+    return pd.read_csv(csv_path, dtype=c_types)
+
+
+def run(data_dir, year=None, freq=None, max_workers=None, count_only=False):
     """Analyze EPA CAMPD hourly and daily CSV files for data gaps.
 
     Prints to console each CSV file found, the number of lines read, and
     whether any months were not reported (including a list of month integers
     where no data were identified).
+
+    Files are independent of one another, so they are read and analyzed in
+    a pool of processes (see :func:`analyze_file`); results are printed in
+    the main process in file order.
+
+    Parameters
+    ----------
+    data_dir : str
+        A directory path where the EPA CAMPD archive CSV files are located.
+    year : int, optional
+        The year to search for, by default None
+    freq : str, optional
+        A choice between 'hourly', 'daily' and None (i.e., both), by default None
+    max_workers : int, optional
+        The maximum number of processes to use, by default None (i.e., the
+        number of processors on the machine).
+    count_only : bool, optional
+        Whether to only count the lines in each file (see
+        :func:`count_lines`) and skip the check for missing months, by
+        default False.
     """
     # Find the EPA CAMPD CSV files based on the parameters
-    my_glob = build_glob(data_dir, year, freq)
-    my_files = glob.glob(my_glob)
+    my_files = list_archives(data_dir, year, freq)
     num_files = len(my_files)
 
     if num_files == 0:
@@ -548,21 +966,46 @@ def run(data_dir, year=None, freq=None):
     # Initialize the total lines read
     tot_lines = 0
 
-    for my_file in my_files:
-        f_name = os.path.basename(my_file)
-        my_data = pd.read_csv(my_file)
-        lines_read, mos_missed, mos_list = analyze_df(my_data)
-        if lines_read is None:
-            print("Failed to find date column in file, '%s'!" % f_name)
-        else:
-            # Increment total lines read.
+    if count_only:
+        # Line counting is I/O-bound; overlap it with read-ahead of the next
+        # file rather than spinning up worker processes.
+        prefetch_file(my_files[0])
+        for i, my_file in enumerate(my_files):
+            if i + 1 < num_files:
+                prefetch_file(my_files[i + 1])
+            lines_read = count_lines(my_file)
             tot_lines += lines_read
-            if mos_missed > 0:
-                print(
-                    "Missing %d months %s (%s)" % (mos_missed, mos_list, f_name)
-                )
+            print("%s,%d" % (os.path.basename(my_file), lines_read))
+        print("Read %d lines from %d files" % (tot_lines, num_files))
+        return None
+
+    # Worker processes only pay off with more than one file (and worker);
+    # never start more workers than there are files.
+    num_workers = min(max_workers or os.cpu_count() or 1, num_files)
+    executor = None
+    if num_workers > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(num_workers)
+        results = executor.map(analyze_file, my_files)
+    else:
+        results = map(analyze_file, my_files)
+
+    try:
+        for f_name, lines_read, mos_missed, mos_list in results:
+            if lines_read is None:
+                print("Failed to find date column in file, '%s'!" % f_name)
             else:
-                print("%s,%d" % (f_name, lines_read))
+                # Increment total lines read.
+                tot_lines += lines_read
+                if mos_missed > 0:
+                    print(
+                        "Missing %d months %s (%s)" % (
+                            mos_missed, mos_list, f_name)
+                    )
+                else:
+                    print("%s,%d" % (f_name, lines_read))
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("Read %d lines from %d files" % (tot_lines, num_files))
 
@@ -6,12 +6,13 @@
 ##############################################################################
 # REQUIRED MODULES
 ##############################################################################
+import concurrent.futures
+import contextlib
 import logging
 import os
 import re
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
 from netlolca.NetlOlca import NetlOlca
@@ -131,6 +132,11 @@ Nitrogen oxides, to air.
 >>> us_nox_df = emission_analysis(json_dict, nox_uuid)
 >>> us_nox_df.round(4)
 >>> plot_fuel_results(us_nox_df, "NOx", "kg/MWh")
+
+Several emissions at once (each JSON-LD is read only once).
+
+>>> e_dfs = emission_analysis(json_dict, [co2_air_uuid, so2_uuid, nox_uuid])
+>>> e_dfs[so2_uuid].round(4)
 """
 
 
@@ -155,6 +161,18 @@ FUEL_CATS = [
 ]
 '''list : Electricity baseline primary fuel categories.'''
 
+FUEL_INDEX = {f_cat: i for i, f_cat in enumerate(FUEL_CATS)}
+'''dict : Primary fuel categories (keys) and their index in FUEL_CATS.'''
+
+Q_BA_PREFIX = re.compile(r"^eGRID 20(?:16|21)\. From ")
+'''re.Pattern : eGRID prefix query for BA names (removed when cleaning).'''
+
+Q_FUEL = re.compile(r"^from (\w+) - (.*)$")
+'''re.Pattern : Fuel name query for BA input exchange descriptions.'''
+
+Q_US_MIX = re.compile(r"^Electricity; at grid; consumption mix - US - US$")
+'''re.Pattern : Process name query for the U.S. grid consumption mix.'''
+
 
 ##############################################################################
 # FUNCTIONS
@@ -172,9 +190,9 @@ def get_emission_by_fuel(json_ld, e_uuid):
     Returns
     -------
     dict
-        A dictionary of primary fuel categories (keys) and their total
-        emission amounts (i.e., scaled based on Balancing Authority mix
-        percentages)
+        A dictionary of primary fuel categories (keys, in the order of
+        FUEL_CATS) and their total emission amounts (i.e., scaled based on
+        Balancing Authority mix percentages).
 
     Raises
     ------
@@ -182,98 +200,161 @@ def get_emission_by_fuel(json_ld, e_uuid):
         Failed to find the JSON-LD file.
     ValueError
         Failed to find the emission flow in the JSON-LD database.
+    KeyError
+        The emission is found for a fuel category not in FUEL_CATS.
+
+    Notes
+    -----
+    To analyze several emissions, use :func:`get_emissions_by_fuel`, which
+    reads the JSON-LD database only once.
+    """
+    return get_emissions_by_fuel(json_ld, [e_uuid])[e_uuid].to_dict()
+
+
+def get_emissions_by_fuel(json_ld, e_uuids):
+    """Return series of emission amounts by primary fuel type for several
+    emissions.
+
+    The JSON-LD database is opened and read once, and the U.S. consumption
+    mix, its Balancing Authority providers, and their region-fuel providers
+    are traversed once for all emissions.
+
+    Parameters
+    ----------
+    json_ld : str
+        A file path to a JSON-LD database.
+    e_uuids : list
+        A list of universally unique identifiers to emissions.
+
+    Returns
+    -------
+    dict
+        A dictionary of emission UUIDs (keys) and their total emission
+        amounts (values; pandas.Series named 'amount' and indexed by primary
+        fuel category in the order of FUEL_CATS).
+
+    Raises
+    ------
+    OSError
+        Failed to find the JSON-LD file.
+    ValueError
+        Failed to find an emission flow in the JSON-LD database.
+    KeyError
+        An emission is found for a fuel category not in FUEL_CATS.
     """
     if not os.path.isfile(json_ld):
         raise OSError("Failed to find JSON-LD, %s" % json_ld)
 
-    # Initialize fuel mix dictionary
-    logging.info("Initializing fuel mix dictionary")
-    fuel_dict = dict()
-    for f_cat in FUEL_CATS:
-        fuel_dict[f_cat] = 0.0
+    # Initialize the flattened (BA, fuel, provider) table; one row per
+    # region-fuel provider, with an emission sum column for each UUID.
+    ba_mix_list = []
+    fuel_mix_list = []
+    fuel_name_list = []
+    e_vals = dict()
+    for e_uuid in e_uuids:
+        e_vals[e_uuid] = []
 
-    # Initialize fuel name query
-    q_fuel = re.compile("^from (\\w+) - (.*)$")
+    # Emission sums (per UUID) for each region-fuel provider visited
+    provider_sums = dict()
 
     logging.info("Reading JSON-LD file")
-    netl = NetlOlca()
-    netl.open(json_ld)
-    netl.read()
-
-    # Check for flow existence in JSON-LD
-    flow = netl.query(netl.get_spec_class("Flow"), e_uuid)
-    if flow:
-        flow_str = "%s, %s" % (flow.name, flow.category)
-        logging.info("Processing %s" % flow_str)
-    else:
-        raise ValueError("Failed to find emission flow!")
-
-    # Find the U.S. grid consumption mix.
-    q = re.compile("^Electricity; at grid; consumption mix - US - US$")
-    r = netl.match_process_names(q)
-    if len(r) == 1:
-        logging.info("Found U.S. consumption mix process")
-        us_uid = r[0][0]
-
-        # US flows are by BA area.
-        # Get ba mix values, then search provider for fuel-based inventory
-        us_flows = netl.get_flows(us_uid, inputs=True, outputs=False)
-        ba_mixes = us_flows['amount']
-        ba_uuids = us_flows['provider']
-        num_mixes = len(ba_mixes)
-        logging.info("Processing %d BA areas" % num_mixes)
-        for i in range(num_mixes):
-            # This is the BA mix coefficient (at U.S. consumption level).
-            ba_mix = ba_mixes[i]
-
-            # Get input exchange values---these should be for primary fuels
-            ba_uid = ba_uuids[i]
-            ba_exchanges = netl.get_flows(ba_uid, inputs=True, outputs=False)
-            ba_fuel_mixes = ba_exchanges['amount']
-            ba_fuel_descr = ba_exchanges['description']
-            ba_fuel_providers = ba_exchanges['provider']
-            # Pull fuel names from description text.
-            ba_fuel_names = []
-            for ba_fuel in ba_fuel_descr:
-                r = q_fuel.match(ba_fuel)
-                f_name = ""
-                if r:
-                    f_name = r.group(1)
-                ba_fuel_names.append(f_name)
-
-            # For each primary fuel represented in a BA, get its provider:
-            # these are the region-fuel LCIs
-            num_fuels = len(ba_fuel_mixes)
-            for j in range(num_fuels):
-                fuel_name = ba_fuel_names[j]
-                fuel_mix = ba_fuel_mixes[j]
-                fuel_provider = ba_fuel_providers[j]
-
-                # Dig into the provider's emissions
-                fuel_emissions = netl.get_flows(
-                    fuel_provider, inputs=False, outputs=True)
-
-                # Match fuel emissions to the requested UUID;
-                # NOTE: an emission may show up more than once in an exchange
-                # table, so don't just return index!
-                emis_uuids = fuel_emissions['uuid']
-                num_uuids = len(emis_uuids)
-                emis_index = [
-                    k for k in range(num_uuids) if emis_uuids[k] == e_uuid]
-
-                for e_idx in emis_index:
-                    # Emissions are in units per MWh
-                    # For example, 10% U.S. electricity from BA1 (ba_mix),
-                    # which is powered 20% by coal (fuel_mix), which emits
-                    # 100 kg/MWh of CO2 (e_val), then the U.S. value is
-                    # .1 * .2 * 100.0 = 2 kg/MWh
-                    e_val = fuel_emissions['amount'][e_idx]
-                    fuel_dict[fuel_name] += ba_mix*fuel_mix*e_val
-
-    logging.info("Done! Closing JSON-LD")
-    netl.close()
-
-    return fuel_dict
+    with open_json_ld(json_ld) as netl:
+        # Check for flow existence in JSON-LD
+        for e_uuid in e_vals:
+            flow = netl.query(netl.get_spec_class("Flow"), e_uuid)
+            if flow:
+                logging.info(
+                    "Processing %s, %s", flow.name, flow.category)
+            else:
+                raise ValueError("Failed to find emission flow, %s!" % e_uuid)
+
+        # Find the U.S. grid consumption mix.
+        r = netl.match_process_names(Q_US_MIX)
+        if len(r) == 1:
+            logging.info("Found U.S. consumption mix process")
+            us_uid = r[0][0]
+
+            # US flows are by BA area.
+            # Get ba mix values, then search provider for fuel-based inventory
+            us_flows = netl.get_flows(us_uid, inputs=True, outputs=False)
+            ba_mixes = us_flows['amount']
+            ba_uuids = us_flows['provider']
+            num_mixes = len(ba_mixes)
+            logging.info("Processing %d BA areas", num_mixes)
+            # The BA mix is the coefficient at U.S. consumption level.
+            for ba_mix, ba_uid in zip(ba_mixes, ba_uuids):
+                # Get input exchange values---these should be for primary fuels
+                ba_exchanges = netl.get_flows(
+                    ba_uid, inputs=True, outputs=False)
+                ba_fuel_mixes = ba_exchanges['amount']
+                ba_fuel_descr = ba_exchanges['description']
+                ba_fuel_providers = ba_exchanges['provider']
+                # Pull fuel names from description text.
+                ba_fuel_names = pd.Series(
+                    ba_fuel_descr, dtype=object
+                ).str.extract(Q_FUEL)[0].fillna("").tolist()
+
+                # For each primary fuel represented in a BA, get its provider:
+                # these are the region-fuel LCIs
+                for fuel_name, fuel_mix, fuel_provider in zip(
+                        ba_fuel_names, ba_fuel_mixes, ba_fuel_providers):
+                    # Dig into the provider's emissions (once for all UUIDs);
+                    # region-fuel providers may be shared by several BAs, so
+                    # only read each one's exchange table once.
+                    if fuel_provider not in provider_sums:
+                        fuel_emissions = netl.get_flows(
+                            fuel_provider, inputs=False, outputs=True)
+
+                        # Match fuel emissions to the requested UUIDs in one
+                        # pass (most providers emit few of them);
+                        # NOTE: an emission may show up more than once in an
+                        # exchange table, so sum over all matching rows!
+                        emis_sums = dict()
+                        for emis_uuid, emis_amount in zip(
+                                fuel_emissions['uuid'],
+                                fuel_emissions['amount']):
+                            if emis_uuid in e_vals:
+                                emis_sums[emis_uuid] = (
+                                    emis_sums.get(emis_uuid, 0.0)
+                                    + emis_amount)
+                        provider_sums[fuel_provider] = [
+                            emis_sums.get(e_uuid, 0.0) for e_uuid in e_vals]
+
+                    for vals, e_sum in zip(
+                            e_vals.values(), provider_sums[fuel_provider]):
+                        vals.append(e_sum)
+
+                    ba_mix_list.append(ba_mix)
+                    fuel_mix_list.append(fuel_mix)
+                    fuel_name_list.append(fuel_name)
+
+    logging.info("Done! Closed JSON-LD")
+
+    # Emissions are in units per MWh
+    # For example, 10% U.S. electricity from BA1 (ba_mix), which is powered
+    # 20% by coal (fuel_mix), which emits 100 kg/MWh of CO2 (e_val), then
+    # the U.S. value is .1 * .2 * 100.0 = 2 kg/MWh
+    mix_arr = (
+        np.asarray(ba_mix_list, dtype=np.float64)
+        * np.asarray(fuel_mix_list, dtype=np.float64)
+    )
+    # Fuel names outside FUEL_CATS (e.g., a renamed eLCI fuel category)
+    # would be dropped by the reindex below, under-counting the totals.
+    unknown_fuels = set(fuel_name_list).difference(FUEL_CATS)
+    is_unknown = np.asarray(
+        [x in unknown_fuels for x in fuel_name_list], dtype=bool)
+    e_totals = dict()
+    for e_uuid, vals in e_vals.items():
+        contrib = pd.Series(mix_arr * np.asarray(vals, dtype=np.float64))
+        if np.any(contrib.to_numpy()[is_unknown] != 0):
+            raise KeyError(
+                "Emission %s found for unknown fuel categories, %s" % (
+                    e_uuid, sorted(unknown_fuels)))
+        e_totals[e_uuid] = contrib.groupby(
+            fuel_name_list
+        ).sum().reindex(FUEL_CATS, fill_value=0.0).rename('amount')
+
+    return e_totals
 
 
 def get_fuel_mix(json_ld):
@@ -301,114 +382,175 @@ def get_fuel_mix(json_ld):
     if not os.path.isfile(json_ld):
         raise OSError("Failed to find JSON-LD, %s" % json_ld)
 
-    # Initialize fuel mix dictionary
-    logging.info("Initializing fuel mix dictionary")
-    fuel_dict = dict()
-    for f_cat in FUEL_CATS:
-        fuel_dict[f_cat] = 0.0
+    # Initialize fuel mix totals (in FUEL_CATS order)
+    logging.info("Initializing fuel mix totals")
+    fuel_totals = np.zeros(len(FUEL_CATS))
 
     ba_list = []
 
-    # Initialize fuel name query
-    q_fuel = re.compile("^from (\\w+) - (.*)$")
-
     logging.info("Reading JSON-LD file")
-    netl = NetlOlca()
-    netl.open(json_ld)
-    netl.read()
-    q = re.compile("^Electricity; at grid; consumption mix - US - US$")
-    r = netl.match_process_names(q)
-    if len(r) == 1:
-        logging.info("Found U.S. consumption mix process")
-        us_uid = r[0][0]
-
-        # US flows are by BA area.
-        # Get ba mix values, then search provider for fuel-based inventory
-        us_flows = netl.get_flows(us_uid, inputs=True, outputs=False)
-        ba_mixes = us_flows['amount']
-        ba_uuids = us_flows['provider']
-        ba_names = us_flows['description']
-        num_mixes = len(ba_mixes)
-        logging.info("Processing %d BA areas" % num_mixes)
-        for i in range(num_mixes):
-            # This is the BA mix coefficient.
-            ba_mix = ba_mixes[i]
-            ba_list.append(ba_names[i])
-
-            # Get input exchange values---these should be for primary fuels
-            ba_uid = ba_uuids[i]
-            ba_exchanges = netl.get_flows(ba_uid, inputs=True, outputs=False)
-            ba_fuel_mixes = ba_exchanges['amount']
-            ba_fuel_descr = ba_exchanges['description']
-            # Pull fuel names from description text.
-            ba_fuel_names = []
-            for ba_fuel in ba_fuel_descr:
-                r = q_fuel.match(ba_fuel)
-                f_name = ""
-                if r:
-                    f_name = r.group(1)
-                ba_fuel_names.append(f_name)
-
-            num_fuels = len(ba_fuel_mixes)
-            for j in range(num_fuels):
-                fuel_name = ba_fuel_names[j]
-                fuel_mix = ba_fuel_mixes[j]
-
-                # Here's the math:
-                # Update the value of fuel_dict[fuel_name] with
-                # `ba_mix` * `fuel_mix`. Because both coefficients
-                # are fractions of one, we should be able to just
-                # sum them up across all BA areas in the U.S.
-                # for each fuel category
-                fuel_dict[fuel_name] += ba_mix*fuel_mix
-
-    logging.info("Done! Closing JSON-LD")
-    netl.close()
+    with open_json_ld(json_ld) as netl:
+        r = netl.match_process_names(Q_US_MIX)
+        if len(r) == 1:
+            logging.info("Found U.S. consumption mix process")
+            us_uid = r[0][0]
+
+            # US flows are by BA area.
+            # Get ba mix values, then search provider for fuel-based inventory
+            us_flows = netl.get_flows(us_uid, inputs=True, outputs=False)
+            ba_mixes = us_flows['amount']
+            ba_uuids = us_flows['provider']
+            ba_names = us_flows['description']
+            num_mixes = len(ba_mixes)
+            logging.info("Processing %d BA areas", num_mixes)
+            # The BA mix is the coefficient at U.S. consumption level.
+            for ba_mix, ba_uid, ba_name in zip(ba_mixes, ba_uuids, ba_names):
+                ba_list.append(ba_name)
+
+                # Get input exchange values---these should be for primary fuels
+                ba_exchanges = netl.get_flows(
+                    ba_uid, inputs=True, outputs=False)
+                ba_fuel_mixes = ba_exchanges['amount']
+                ba_fuel_descr = ba_exchanges['description']
+                # Pull fuel names from description text.
+                ba_fuel_names = pd.Series(
+                    ba_fuel_descr, dtype=object
+                ).str.extract(Q_FUEL)[0].fillna("").tolist()
+
+                for fuel_name, fuel_mix in zip(ba_fuel_names, ba_fuel_mixes):
+                    # Here's the math:
+                    # Update the total for fuel_name with
+                    # `ba_mix` * `fuel_mix`. Because both coefficients
+                    # are fractions of one, we should be able to just
+                    # sum them up across all BA areas in the U.S.
+                    # for each fuel category
+                    f_idx = FUEL_INDEX.get(fuel_name)
+                    if f_idx is not None:
+                        fuel_totals[f_idx] += ba_mix*fuel_mix
+
+    logging.info("Done! Closed JSON-LD")
+
+    fuel_dict = dict(zip(FUEL_CATS, fuel_totals.tolist()))
 
     return (fuel_dict, ba_list)
 
 
-def emission_analysis(json_ld, e_uuid):
-    """Run emission analysis on a JSON-LD database for a given flow UUID.
+def map_json_ld(func, json_ld, *args, max_workers=None):
+    """Helper method to apply a function to each JSON-LD database.
+
+    The databases are independent, so each is processed in its own worker
+    process (the JSON parsing holds the GIL, so threads do not help).
 
     Parameters
     ----------
+    func : callable
+        A module-level function that takes a JSON-LD file path as its first
+        argument (e.g., :func:`get_fuel_mix`).
     json_ld : dict
         A dictionary of JSON-LD database file paths.
-    e_uuid : str
-        A universally unique identifier for an emission flow.
+    *args
+        Additional arguments passed to `func` for every database.
+    max_workers : int, optional
+        The maximum number of processes to use, by default None (i.e., the
+        number of processors on the machine).
 
     Returns
     -------
-    pandas.DataFrame
-        A dataframe of fuel-specific emission totals.
+    dict
+        A dictionary of the same keys as `json_ld` (and in the same order)
+        with the return values of `func` as values.
     """
-    # Create empty data frame
-    df = pd.DataFrame({'Fuel': FUEL_CATS})
-
-    # Iterate over each JSON-LD file
-    for k, v in json_ld.items():
-        var_pm_fuel = get_emission_by_fuel(v, e_uuid)
-        tmp_dict = {
-            'Fuel': FUEL_CATS,
-            k: [var_pm_fuel[x] for x in FUEL_CATS],
-        }
-        tmp_df = pd.DataFrame(tmp_dict)
-        df = df.merge(
-            tmp_df,
-            how='left',
-            on='Fuel'
-        )
-    # Add total row
-    total_df = {'Fuel': ['TOTAL',]}
-    for k,v in json_ld.items():
-        total_df[k] = [df[k].sum(),]
-    df = pd.concat([df, pd.DataFrame(total_df)])
+    keys = list(json_ld)
+    paths = [json_ld[k] for k in keys]
+    f_args = [paths] + [[x]*len(paths) for x in args]
+
+    # Never start more workers than there are databases.
+    num_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if num_workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+            results = list(executor.map(func, *f_args))
+    else:
+        results = list(map(func, *f_args))
+
+    return dict(zip(keys, results))
+
+
+@contextlib.contextmanager
+def open_json_ld(json_ld):
+    """Helper method to open and read a JSON-LD database, closing it when
+    done (even on error).
+
+    Parameters
+    ----------
+    json_ld : str
+        A file path to a JSON-LD database.
+
+    Yields
+    ------
+    netlolca.NetlOlca.NetlOlca
+        The opened and read JSON-LD database.
+    """
+    netl = NetlOlca()
+    netl.open(json_ld)
+    try:
+        netl.read()
+        yield netl
+    finally:
+        netl.close()
 
-    return df
 
+def emission_analysis(json_ld, e_uuid, max_workers=None):
+    """Run emission analysis on a JSON-LD database for a given flow UUID.
+
+    Parameters
+    ----------
+    json_ld : dict
+        A dictionary of JSON-LD database file paths.
+    e_uuid : str or list
+        A universally unique identifier for an emission flow, or a list of
+        them. Each JSON-LD database is read once regardless of the number of
+        emissions (see :func:`get_emissions_by_fuel`).
+    max_workers : int, optional
+        The maximum number of processes used to read the JSON-LD databases
+        in parallel, by default None (i.e., the number of processors on the
+        machine).
 
-def fuel_mix_analysis(json_ld, add_total=False):
+    Returns
+    -------
+    pandas.DataFrame or dict
+        A dataframe of fuel-specific emission totals. For a list of UUIDs, a
+        dictionary of UUIDs (keys) and their data frames (values).
+    """
+    e_uuids = e_uuid
+    if isinstance(e_uuid, str):
+        e_uuids = [e_uuid]
+
+    # Collect data frame columns, one per JSON-LD file
+    e_cols = dict()
+    for x in e_uuids:
+        e_cols[x] = {'Fuel': FUEL_CATS}
+
+    # Process each JSON-LD file
+    db_results = map_json_ld(
+        get_emissions_by_fuel, json_ld, e_uuids, max_workers=max_workers)
+    for k, var_e_fuels in db_results.items():
+        for x, var_pm_fuel in var_e_fuels.items():
+            e_cols[x][k] = var_pm_fuel.to_numpy()
+
+    # Build data frames and add total row
+    e_dfs = dict()
+    for x, cols in e_cols.items():
+        df = pd.DataFrame(cols)
+        totals = df.drop(columns='Fuel').sum(axis=0)
+        total_df = pd.DataFrame([{'Fuel': 'TOTAL', **totals.to_dict()}])
+        e_dfs[x] = pd.concat([df, total_df], ignore_index=True)
+
+    if isinstance(e_uuid, str):
+        return e_dfs[e_uuid]
+    return e_dfs
+
+
+def fuel_mix_analysis(json_ld, add_total=False, max_workers=None):
     """Run the U.S. fuel mix analysis.
 
     Parameters
@@ -417,6 +559,10 @@ def fuel_mix_analysis(json_ld, add_total=False):
         A dictionary of JSON-LD file paths.
     add_total : bool, optional
         If true, the total column is the returned data frame, by default False
+    max_workers : int, optional
+        The maximum number of processes used to read the JSON-LD databases
+        in parallel, by default None (i.e., the number of processors on the
+        machine).
 
     Returns
     -------
@@ -424,40 +570,29 @@ def fuel_mix_analysis(json_ld, add_total=False):
         A tuple of length two: pandas.DataFrame of results and dictionary of
         Balancing Authority codes for each database processed.
     """
-    # Initialize data frame
-    df = pd.DataFrame({'Fuel': FUEL_CATS})
+    # Collect data frame columns, one per JSON-LD file
+    df_cols = {'Fuel': FUEL_CATS}
 
     ba_dict = {}
 
-    for k,v in json_ld.items():
-        var_us_mix, var_bas = get_fuel_mix(v)
-
+    db_results = map_json_ld(get_fuel_mix, json_ld, max_workers=max_workers)
+    for k, (var_us_mix, var_bas) in db_results.items():
         logging.info("Cleaning BA names")
-        var_bas = [x.replace("eGRID 2016. From ", "") for x in var_bas]
-        var_bas = [x.replace("eGRID 2021. From ", "") for x in var_bas]
-        var_bas = sorted(var_bas)
+        var_bas = sorted(Q_BA_PREFIX.sub("", x) for x in var_bas)
 
         # Append BA list to return dictionary
         ba_dict[k] = var_bas
 
-        # Append fuel mix to data frame
-        tmp_dict = {
-            'Fuel': FUEL_CATS,
-            k: [var_us_mix[x] for x in FUEL_CATS],
-        }
-        tmp_df = pd.DataFrame(tmp_dict)
-        df = df.merge(
-            tmp_df,
-            how='left',
-            on='Fuel'
-        )
+        # Append fuel mix to data frame columns
+        df_cols[k] = [var_us_mix[x] for x in FUEL_CATS]
+
+    df = pd.DataFrame(df_cols)
 
     # Add total row
     if add_total:
-        total_df = {'Fuel': ['TOTAL',]}
-        for k,v in json_ld.items():
-            total_df[k] = [df[k].sum(),]
-        df = pd.concat([df, pd.DataFrame(total_df)])
+        totals = df.drop(columns='Fuel').sum(axis=0)
+        total_df = pd.DataFrame([{'Fuel': 'TOTAL', **totals.to_dict()}])
+        df = pd.concat([df, total_df], ignore_index=True)
 
     return (df, ba_dict)
 
@@ -477,6 +612,11 @@ def plot_fuel_results(df, y_cat, units="", to_save=True):
     to_save : bool, optional
         Whether to save the figure to PNG file, by default True
     """
+    # Plotting libraries are only needed here; keep them out of the
+    # analysis (and worker process) imports.
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Creates a three column data frame of 'Fuel' categories, 'model'
     # categories (i.e., the column headers in `df`), and y_cat (i.e.,
     # whatever the numbers represent, such as CO2 emissions).
@@ -487,6 +627,12 @@ def plot_fuel_results(df, y_cat, units="", to_save=True):
         var_name="Model",
         value_name=y_cat
     )
+    # Fix the plotting order to the data frame's (i.e., FUEL_CATS, plus any
+    # TOTAL row, and the model columns as given).
+    dfm['Fuel'] = pd.Categorical(
+        dfm['Fuel'], categories=pd.unique(df['Fuel']), ordered=True)
+    dfm['Model'] = pd.Categorical(
+        dfm['Model'], categories=[x for x in df.columns if x != 'Fuel'])
     g = sns.catplot(
         x='Fuel',
         y=y_cat,
@@ -502,7 +648,7 @@ def plot_fuel_results(df, y_cat, units="", to_save=True):
         g.set(ylabel=y_label)
 
     # Add a second legend; crop out the first
-    ncols = len(dfm['Model'].unique())
+    ncols = len(dfm['Model'].cat.categories)
     g.figure.legend(loc=9, ncol=ncols, frameon=False, title="Model")
     if to_save:
         out_fig = "%s.png" % y_cat.lower()
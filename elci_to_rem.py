@@ -7,14 +7,29 @@
 # REQUIRED MODULES
 ##############################################################################
 import argparse
+import bisect
+import concurrent.futures
+import functools
 import logging
+import multiprocessing
 import os
 from zipfile import ZipFile
 from zipfile import ZIP_DEFLATED
 
-import geopandas as gpd
+import numpy as np
 import pandas as pd
-import requests
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 
 ##############################################################################
@@ -33,13 +48,16 @@ is particularly true when multiple years of residual mixes are to be generated.
 The challenge is using eLCI over multiple years, which requires a kernel restart
 due to how configuration data are stored in memory.
 
-This module contains four global parameters:
+This module contains five global parameters:
 
 -   DATA_DIR (str), the output data directory
--   GREEN_E (list), the primary fuel categories associated with renewable energy
--   OVERFLOW_E (list), the primary fuel categories that could have renewable
-    energy associated with them (i.e., broad categories)
+-   GREEN_E (frozenset), the primary fuel categories associated with
+    renewable energy
+-   OVERFLOW_E (frozenset), the primary fuel categories that could have
+    renewable energy associated with them (i.e., broad categories)
 -   ELCI_LOADED (bool), a tracker for if/when ElectricityLCI package is loaded.
+-   BA_NAME_MAP (dict), HIFLD balancing authority names mapped to EIA Form
+    860 names (see :func:`correct_ba_geo_names`).
 
 The main method for calculating the residual grid mixes is :func:`run`, which
 calls :func:`get_elci_mix` to get the generation mix for a given year based on
@@ -70,7 +88,9 @@ two ways of handling it:
 2.  Zero the green energy. Excess remains unaccounted.
 
 The recommended (and default) options are to use the "zero" accounting and
-"facility count" aggregation methods.
+"facility count" aggregation methods. The geospatial packages (geopandas
+and shapely) are only imported for the areal weighting method, and requests
+only when a file needs downloading.
 
 Note that this module may create up to three files that are, by default,
 saved in a local "data" folder. These files are:
@@ -103,8 +123,9 @@ module. The usage and arguments are as follows::
         method for managing negative renewable generation
     -a {area,count}, --agg_method {area,count}
         method for aggregating REC generation from states to BA areas
-    -y YEAR, --year YEAR
-        generation year (e.g., 2016 or 2020)
+    -y YEAR [YEAR ...], --year YEAR [YEAR ...]
+        generation year(s) (e.g., 2016 or 2020); multiple years are run in
+        parallel worker processes (see :func:`run_years`)
     -v, --verbose
         print results to console
     -s, --save
@@ -123,6 +144,7 @@ Examples:
 >>> python main.py -s # run defaults and save to CSV file
 >>> python main.py -f "./data/nrel-green-power-data-v2023.xlsx" -v
 >>> python main.py -a "count" -r "zero" -y 2016 -s
+>>> python main.py -y 2016 2020 2022 -s # one worker process per year
 
 Version:
     2.0.1
@@ -138,12 +160,159 @@ Changelog:
 ##############################################################################
 DATA_DIR = "data"
 '''str: Local directory for storing data files.'''
-GREEN_E = ['HYDRO', 'BIOMASS', 'SOLAR', 'SOLARTHERMAL', 'WIND', 'GEOTHERMAL']
-'''list: Green or renewable energy categories.'''
-OVERFLOW_E = ['MIXED', 'OTHF']
-'''list: Non-renewable fuel categories that can lend overflow electricity.'''
+GREEN_E = frozenset(
+    ['HYDRO', 'BIOMASS', 'SOLAR', 'SOLARTHERMAL', 'WIND', 'GEOTHERMAL'])
+'''frozenset: Green or renewable energy categories.'''
+OVERFLOW_E = frozenset(['MIXED', 'OTHF'])
+'''frozenset: Non-renewable fuel categories that can lend overflow electricity.'''
 ELCI_LOADED = False
 '''bool: Tracker for if/when to load ElectricityLCI package.'''
+BA_NAME_MAP = {
+    'NEW BRUNSWICK SYSTEM OPERATOR': (
+        'New Brunswick System Operator'),
+    'POWERSOUTH ENERGY COOPERATIVE': (
+        'PowerSouth Energy Cooperative'),
+    'ALCOA POWER GENERATING, INC. - YADKIN DIVISION': (
+        'Alcoa Power Generating, Inc. - Yadkin Division'),
+    'ARIZONA PUBLIC SERVICE COMPANY': (
+        'Arizona Public Service Company'),
+    'ASSOCIATED ELECTRIC COOPERATIVE, INC.': (
+        'Associated Electric Cooperative, Inc.'),
+    'BONNEVILLE POWER ADMINISTRATION': (
+        'Bonneville Power Administration'),
+    'CALIFORNIA INDEPENDENT SYSTEM OPERATOR': (
+        'California Independent System Operator'),
+    'DUKE ENERGY PROGRESS EAST': (
+        'Duke Energy Progress East'),
+    'PUBLIC UTILITY DISTRICT NO. 1 OF CHELAN COUNTY': (
+        'Public Utility District No. 1 of Chelan County'),
+    'CHUGACH ELECTRIC ASSN INC': (
+        'Chugach Electric Assn Inc'),
+    'PUD NO. 1 OF DOUGLAS COUNTY': (
+        'PUD No. 1 of Douglas County'),
+    'DUKE ENERGY CAROLINAS': (
+        'Duke Energy Carolinas'),
+    'EL PASO ELECTRIC COMPANY': (
+        'El Paso Electric Company'),
+    'ELECTRIC RELIABILITY COUNCIL OF TEXAS, INC.': (
+        'Electric Reliability Council of Texas, Inc.'),
+    'ELECTRIC ENERGY, INC.': (
+        'Electric Energy, Inc.'),
+    'FLORIDA POWER & LIGHT COMPANY': (
+        'Florida Power & Light Co.'),
+    'DUKE ENERGY FLORIDA INC': (
+        'Duke Energy Florida, Inc.'),
+    'GAINESVILLE REGIONAL UTILITIES': (
+        'Gainesville Regional Utilities'),
+    'CITY OF HOMESTEAD': (
+        'City of Homestead'),  # fixed for eLCIv2
+    'IDAHO POWER COMPANY': (
+        'Idaho Power Company'),
+    'IMPERIAL IRRIGATION DISTRICT': (
+        'Imperial Irrigation District'),
+    'JEA': (
+        'JEA'),
+    'LOS ANGELES DEPARTMENT OF WATER AND POWER': (
+        'Los Angeles Department of Water and Power'),
+    'LOUISVILLE GAS AND ELECTRIC COMPANY AND KENTUCKY UTILITIES': (
+        'Louisville Gas and Electric Company and Kentucky Utilities '
+        'Company'), # fixed for eLCIv2
+    'NORTHWESTERN ENERGY (NWMT)': (
+        'NorthWestern Corporation'),
+    'NEVADA POWER COMPANY': (
+        'Nevada Power Company'),
+    'ISO NEW ENGLAND INC.': (
+        'ISO New England'),  # fixed for eLCIv2
+    'NEW SMYRNA BEACH, UTILITIES COMMISSION OF': (
+        'Utilities Commission of New Smyrna Beach'), # fixed for eLCIv2
+    'NEW YORK INDEPENDENT SYSTEM OPERATOR': (
+        'New York Independent System Operator'),
+    'OHIO VALLEY ELECTRIC CORPORATION': (
+        'Ohio Valley Electric Corporation'),
+    'PACIFICORP - WEST': (
+        'PacifiCorp West'),
+    'PACIFICORP - EAST': (
+        'PacifiCorp East'),
+    'GILA RIVER POWER, LLC': (
+        'Gila River Power, LLC'),
+    'FLORIDA MUNICIPAL POWER POOL': (
+        'Florida Municipal Power Pool'),
+    'PUBLIC UTILITY DISTRICT NO. 2 OF GRANT COUNTY, WASHINGTON': (
+        'Public Utility District No. 2 of Grant County, Washington'),
+    'PJM INTERCONNECTION, LLC': (
+        'PJM Interconnection, LLC'),
+    'PORTLAND GENERAL ELECTRIC COMPANY': (
+        'Portland General Electric Company'),
+    'AVANGRID RENEWABLES LLC': (
+        'Avangrid Renewables, LLC'), # fixed for eLCIv2
+    'PUBLIC SERVICE COMPANY OF COLORADO': (
+        'Public Service Company of Colorado'),
+    'PUBLIC SERVICE COMPANY OF NEW MEXICO': (
+        'Public Service Company of New Mexico'),
+    'PUGET SOUND ENERGY': (
+        'Puget Sound Energy, Inc.'),
+    'BALANCING AUTHORITY OF NORTHERN CALIFORNIA': (
+        'Balancing Authority of Northern California'),
+    'SALT RIVER PROJECT': (
+        'Salt River Project Agricultural Improvement and Power District'),
+    'SEATTLE CITY LIGHT': (
+        'Seattle City Light'),
+    'SOUTH CAROLINA ELECTRIC & GAS COMPANY': (
+        'Dominion Energy South Carolina, Inc.'), # fixed for eLCIv2
+    'SOUTH CAROLINA PUBLIC SERVICE AUTHORITY': (
+        'South Carolina Public Service Authority'),
+    'SOUTHWESTERN POWER ADMINISTRATION': (
+        'Southwestern Power Administration'),
+    'SOUTHERN COMPANY SERVICES, INC. - TRANS': (
+        'Southern Company Services, Inc. - Trans'),
+    'CITY OF TACOMA, DEPARTMENT OF PUBLIC UTILITIES, LIGHT DIVISION': (
+        'City of Tacoma, Department of Public Utilities, Light Division'),
+    'CITY OF TALLAHASSEE': (
+        'City of Tallahassee'), # fixed for eLCIv2
+    'TAMPA ELECTRIC COMPANY': (
+        'Tampa Electric Company'),
+    'TENNESSEE VALLEY AUTHORITY': (
+        'Tennessee Valley Authority'),
+    'TURLOCK IRRIGATION DISTRICT': (
+        'Turlock Irrigation District'),
+    'HAWAIIAN ELECTRIC CO INC': (
+        'Hawaiian Electric Co Inc'),
+    'WESTERN AREA POWER ADMINISTRATION UGP WEST': (
+        'Western Area Power Administration - Upper Great Plains West'),
+    'AVISTA CORPORATION': (
+        'Avista Corporation'),
+    'SEMINOLE ELECTRIC COOPERATIVE': (
+        'Seminole Electric Cooperative'),
+    'TUCSON ELECTRIC POWER COMPANY': (
+        'Tucson Electric Power'),
+    'WESTERN AREA POWER ADMINISTRATION - DESERT SOUTHWEST REGION': (
+        'Western Area Power Administration - Desert Southwest Region'),
+    'WESTERN AREA POWER ADMINISTRATION - ROCKY MOUNTAIN REGION': (
+        'Western Area Power Administration - Rocky Mountain Region'),
+    'SOUTHEASTERN POWER ADMINISTRATION': (
+        'Southeastern Power Administration'),
+    'NEW HARQUAHALA GENERATING COMPANY, LLC - HGBA': (
+        'New Harquahala Generating Company, LLC'), # fixed for eLCIv2
+    'GRIFFITH ENERGY, LLC': (
+        'Griffith Energy, LLC'),
+    'NATURENER POWER WATCH, LLC (GWA)': (
+        'NaturEner Power Watch, LLC'), # fixed for eLCIv2
+    'GRIDFORCE SOUTH': (
+        'Gridforce South'),
+    'MIDCONTINENT INDEPENDENT TRANSMISSION SYSTEM OPERATOR, INC..': (
+        'Midcontinent Independent System Operator, Inc.'),
+    'ARLINGTON VALLEY, LLC - AVBA': (
+        'Arlington Valley, LLC'), # fixed for eLCIv2
+    'DUKE ENERGY PROGRESS WEST': (
+        'Duke Energy Progress West'),
+    'GRIDFORCE ENERGY MANAGEMENT, LLC': (
+        'Gridforce Energy Management, LLC'),
+    'NATURENER WIND WATCH, LLC': (
+        'NaturEner Wind Watch, LLC'),
+    'SOUTHWEST POWER POOL': (
+        'Southwest Power Pool'),
+}
+'''dict: HIFLD balancing authority names mapped to EIA Form 860 names.'''
 
 
 ##############################################################################
@@ -178,19 +347,32 @@ def agg_by_area(year, rec_file=None):
         area abbreviation) and the values are 'REC_FRAC' (allocated REC
         generation from states to their BA areas).
     """
+    import shapely
+
     logging.info("Aggregating by area for year %d" % year)
-    # Get geospatial dataframes and project to 2D
-    ba_df = get_ba_geo(correct_names=True)
-    us_df = get_state_geo(year)
-    pcs = ('esri', 102009)
-    ba_df = ba_df.to_crs(pcs)
-    us_df = us_df.to_crs(pcs)
-    # Preserve original state and BA areas
-    ba_df['BAA_KM2'] = ba_df['geometry'].area / 10**6
-    us_df['ST_KM2'] = us_df['geometry'].area / 10**6
-    area_df = gpd.overlay(ba_df, us_df, how='intersection')
-    # Calculate the area of the overlaps in square kilometers:
-    area_df['AREA_KM2'] = area_df['geometry'].area / 10**6
+    # Get projected geospatial dataframes with their original areas
+    ba_df, us_df = get_projected_geo(year)
+    ba_geoms = ba_df.geometry.to_numpy()
+    st_geoms = us_df.geometry.to_numpy()
+
+    # Find candidate state+BA pairs with a spatial index (positional
+    # indices), then intersect only those pairs (rather than a full overlay)
+    tree = shapely.STRtree(ba_geoms)
+    st_idx, ba_idx = tree.query(st_geoms, predicate='intersects')
+    area_df = pd.DataFrame({
+        'BA_CODE': ba_df['BA_CODE'].to_numpy()[ba_idx],
+        'STUSPS': us_df['STUSPS'].to_numpy()[st_idx],
+        'BAA_KM2': ba_df['BAA_KM2'].to_numpy()[ba_idx],
+        'ST_KM2': us_df['ST_KM2'].to_numpy()[st_idx],
+    })
+    # Calculate the area of the overlaps in square kilometers; drop pairs
+    # that only share a boundary (as an overlay would):
+    area_df['AREA_KM2'] = shapely.area(
+        shapely.intersection(ba_geoms[ba_idx], st_geoms[st_idx])) / 10**6
+    area_df = area_df[area_df['AREA_KM2'] > 0]
+
+    # Group and join on categorical (integer-coded) BA and state keys
+    area_df = area_df.astype({'BA_CODE': 'category', 'STUSPS': 'category'})
 
     # Calculate fractional coverage
     area_df['BA_FRAC'] = area_df['AREA_KM2'] / area_df['BAA_KM2']
@@ -198,36 +380,31 @@ def agg_by_area(year, rec_file=None):
 
     # For each BA+state, find the state areas and their fractional coverage
     tmp_df = area_df.groupby(
-        by=['BA_CODE', 'STUSPS'])[['AREA_KM2', 'BA_FRAC', 'ST_FRAC']].agg('sum')
+        by=['BA_CODE', 'STUSPS'],
+        observed=True)[['AREA_KM2', 'BA_FRAC', 'ST_FRAC']].agg('sum')
     tmp_df.index.names = ["BA_CODE", "STATE_ABBR"]
     tmp_df.reset_index(drop=False, inplace=True)
 
     # Convert absolute state fractions to relative fractions (normalize)
     #   after this, summing ST_FRAC for each state should give 1.0
-    for my_st in tmp_df['STATE_ABBR'].unique():
-        my_rows = tmp_df['STATE_ABBR'] == my_st
-        max_val = tmp_df.loc[my_rows, 'ST_FRAC'].sum()
-        tmp_df.loc[my_rows, 'ST_FRAC'] /= max_val
+    tmp_df['ST_FRAC'] /= tmp_df.groupby(
+        'STATE_ABBR', observed=True)['ST_FRAC'].transform('sum')
 
     # Table join REC totals to their respective states
-    rec_df = get_rec(year, rec_path=rec_file)
+    rec_df = get_rec(year, rec_path=rec_file, columns=['State', 'Total'])
     rec_df = rec_df[['State', 'Total']].copy()
     rec_df.rename(
         columns={'State': "STATE_ABBR", 'Total': "REC_GEN"}, inplace=True)
     jdf = tmp_df.merge(rec_df, how='left', on='STATE_ABBR')
 
     # Calculate REC generation based on relative state area fractions
-    # NOTE: 'sum' on REC_GEN keeps original value (no summing)
-    tmp_df = jdf.groupby(
-        by=['STATE_ABBR', 'BA_CODE'])[['ST_FRAC', 'REC_GEN']].agg('sum')
-    tmp_df['REC_FRAC'] = tmp_df['ST_FRAC'] * tmp_df['REC_GEN']
-
-    # Drop indices for easier handling
-    tmp_df.reset_index(drop=False, inplace=True)
+    # NOTE: rows are already unique BA+state pairs (see groupby above)
+    jdf['REC_FRAC'] = jdf['ST_FRAC'] * jdf['REC_GEN']
 
     # Allocate RECs to their BA areas using the new relative fractions
     # The sum of REC_FRAC should equal the sum of Total in the REC data frame
-    tot_df = tmp_df.groupby(by='BA_CODE')['REC_FRAC'].agg("sum")
+    tot_df = jdf.groupby(by='BA_CODE', observed=True)['REC_FRAC'].agg("sum")
+    tot_df.index = tot_df.index.astype(tot_df.index.categories.dtype)
     return tot_df
 
 
@@ -265,25 +442,24 @@ def agg_by_count(year, rec_file=None):
 
     # Not every plant has a BA and State, so drop NAs
     ba_df = ba_df.dropna(subset='BA_CODE')
+    ba_df = ba_df[['State', 'BA_CODE']]
 
-    # Create plant count tables
-    table_1 = ba_df.value_counts(subset=['State', 'BA_CODE'])
-    table_1.name = "STBA_PLANTS"
-    table_2 = ba_df.value_counts(subset=['State'])
-    table_2.name = "ST_PLANTS"
+    # Group and join on categorical (integer-coded) state and BA keys
+    ba_df = ba_df.astype({'State': 'category', 'BA_CODE': 'category'})
 
-    # Join these series together
-    t1_df = table_1.reset_index(drop=False)
-    t2_df = table_2.reset_index(drop=False)
-    t1_df = t1_df.merge(t2_df, how='left', on='State')
+    # Create plant count table by state and BA with state totals
+    t1_df = ba_df.groupby(
+        ['State', 'BA_CODE'], observed=True
+    ).size().rename("STBA_PLANTS").reset_index()
+    t1_df['ST_PLANTS'] = t1_df.groupby(
+        'State', observed=True)['STBA_PLANTS'].transform('sum')
 
     # Calculate state-level fractions
     # these should all add to 1.0 given the NA drop above.
     t1_df["ST_FRAC"] = t1_df['STBA_PLANTS'] / t1_df['ST_PLANTS']
 
     # Join REC data
-    rec_df = get_rec(year,rec_path=rec_file)
-    rec_df = rec_df[['State', 'Total']].copy()
+    rec_df = get_rec(year, rec_path=rec_file, columns=['State', 'Total'])
     jdf = t1_df.merge(rec_df, how='left', on='State')
 
     # Calculate BA REC amounts using plant count fractions
@@ -291,7 +467,8 @@ def agg_by_count(year, rec_file=None):
 
     # Allocate RECs to their BA areas using the new relative fractions
     # the sum of REC_FRAC should equal the sum of Total in the REC data frame
-    tot_df = jdf.groupby(by='BA_CODE')['REC_FRAC'].agg("sum")
+    tot_df = jdf.groupby(by='BA_CODE', observed=True)['REC_FRAC'].agg("sum")
+    tot_df.index = tot_df.index.astype(tot_df.index.categories.dtype)
     tot_df.index.names = ['BA_CODE']
     return tot_df
 
@@ -325,8 +502,10 @@ def calc_relative_ratio(df, add_total=False):
         raise TypeError("Expected data frame, received %s" % type(df))
     if "Electricity" not in df.columns:
         raise IndexError("Data frame missing required 'Electricity' field!")
-    total_e = df['Electricity'].sum()
-    df['Relative_Ratio'] = df['Electricity'] / total_e
+    e_vals = df['Electricity'].to_numpy(dtype='float64', na_value=np.nan)
+    total_e = np.nansum(e_vals)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['Relative_Ratio'] = e_vals / total_e
     if add_total:
         df['Relative_Total'] = total_e
     return df
@@ -367,152 +546,7 @@ def correct_ba_geo_names(ba_geo_df):
     geopandas.GeoDataFrame
         The same as the input data frame with a new mapped column, 'BA_NAME'.
     """
-    m_dict = {
-        'NEW BRUNSWICK SYSTEM OPERATOR': (
-            'New Brunswick System Operator'),
-        'POWERSOUTH ENERGY COOPERATIVE': (
-            'PowerSouth Energy Cooperative'),
-        'ALCOA POWER GENERATING, INC. - YADKIN DIVISION': (
-            'Alcoa Power Generating, Inc. - Yadkin Division'),
-        'ARIZONA PUBLIC SERVICE COMPANY': (
-            'Arizona Public Service Company'),
-        'ASSOCIATED ELECTRIC COOPERATIVE, INC.': (
-            'Associated Electric Cooperative, Inc.'),
-        'BONNEVILLE POWER ADMINISTRATION': (
-            'Bonneville Power Administration'),
-        'CALIFORNIA INDEPENDENT SYSTEM OPERATOR': (
-            'California Independent System Operator'),
-        'DUKE ENERGY PROGRESS EAST': (
-            'Duke Energy Progress East'),
-        'PUBLIC UTILITY DISTRICT NO. 1 OF CHELAN COUNTY': (
-            'Public Utility District No. 1 of Chelan County'),
-        'CHUGACH ELECTRIC ASSN INC': (
-            'Chugach Electric Assn Inc'),
-        'PUD NO. 1 OF DOUGLAS COUNTY': (
-            'PUD No. 1 of Douglas County'),
-        'DUKE ENERGY CAROLINAS': (
-            'Duke Energy Carolinas'),
-        'EL PASO ELECTRIC COMPANY': (
-            'El Paso Electric Company'),
-        'ELECTRIC RELIABILITY COUNCIL OF TEXAS, INC.': (
-            'Electric Reliability Council of Texas, Inc.'),
-        'ELECTRIC ENERGY, INC.': (
-            'Electric Energy, Inc.'),
-        'FLORIDA POWER & LIGHT COMPANY': (
-            'Florida Power & Light Co.'),
-        'DUKE ENERGY FLORIDA INC': (
-            'Duke Energy Florida, Inc.'),
-        'GAINESVILLE REGIONAL UTILITIES': (
-            'Gainesville Regional Utilities'),
-        'CITY OF HOMESTEAD': (
-            'City of Homestead'),  # fixed for eLCIv2
-        'IDAHO POWER COMPANY': (
-            'Idaho Power Company'),
-        'IMPERIAL IRRIGATION DISTRICT': (
-            'Imperial Irrigation District'),
-        'JEA': (
-            'JEA'),
-        'LOS ANGELES DEPARTMENT OF WATER AND POWER': (
-            'Los Angeles Department of Water and Power'),
-        'LOUISVILLE GAS AND ELECTRIC COMPANY AND KENTUCKY UTILITIES': (
-            'Louisville Gas and Electric Company and Kentucky Utilities '
-            'Company'), # fixed for eLCIv2
-        'NORTHWESTERN ENERGY (NWMT)': (
-            'NorthWestern Corporation'),
-        'NEVADA POWER COMPANY': (
-            'Nevada Power Company'),
-        'ISO NEW ENGLAND INC.': (
-            'ISO New England'),  # fixed for eLCIv2
-        'NEW SMYRNA BEACH, UTILITIES COMMISSION OF': (
-            'Utilities Commission of New Smyrna Beach'), # fixed for eLCIv2
-        'NEW YORK INDEPENDENT SYSTEM OPERATOR': (
-            'New York Independent System Operator'),
-        'OHIO VALLEY ELECTRIC CORPORATION': (
-            'Ohio Valley Electric Corporation'),
-        'PACIFICORP - WEST': (
-            'PacifiCorp West'),
-        'PACIFICORP - EAST': (
-            'PacifiCorp East'),
-        'GILA RIVER POWER, LLC': (
-            'Gila River Power, LLC'),
-        'FLORIDA MUNICIPAL POWER POOL': (
-            'Florida Municipal Power Pool'),
-        'PUBLIC UTILITY DISTRICT NO. 2 OF GRANT COUNTY, WASHINGTON': (
-            'Public Utility District No. 2 of Grant County, Washington'),
-        'PJM INTERCONNECTION, LLC': (
-            'PJM Interconnection, LLC'),
-        'PORTLAND GENERAL ELECTRIC COMPANY': (
-            'Portland General Electric Company'),
-        'AVANGRID RENEWABLES LLC': (
-            'Avangrid Renewables, LLC'), # fixed for eLCIv2
-        'PUBLIC SERVICE COMPANY OF COLORADO': (
-            'Public Service Company of Colorado'),
-        'PUBLIC SERVICE COMPANY OF NEW MEXICO': (
-            'Public Service Company of New Mexico'),
-        'PUGET SOUND ENERGY': (
-            'Puget Sound Energy, Inc.'),
-        'BALANCING AUTHORITY OF NORTHERN CALIFORNIA': (
-            'Balancing Authority of Northern California'),
-        'SALT RIVER PROJECT': (
-            'Salt River Project Agricultural Improvement and Power District'),
-        'SEATTLE CITY LIGHT': (
-            'Seattle City Light'),
-        'SOUTH CAROLINA ELECTRIC & GAS COMPANY': (
-            'Dominion Energy South Carolina, Inc.'), # fixed for eLCIv2
-        'SOUTH CAROLINA PUBLIC SERVICE AUTHORITY': (
-            'South Carolina Public Service Authority'),
-        'SOUTHWESTERN POWER ADMINISTRATION': (
-            'Southwestern Power Administration'),
-        'SOUTHERN COMPANY SERVICES, INC. - TRANS': (
-            'Southern Company Services, Inc. - Trans'),
-        'CITY OF TACOMA, DEPARTMENT OF PUBLIC UTILITIES, LIGHT DIVISION': (
-            'City of Tacoma, Department of Public Utilities, Light Division'),
-        'CITY OF TALLAHASSEE': (
-            'City of Tallahassee'), # fixed for eLCIv2
-        'TAMPA ELECTRIC COMPANY': (
-            'Tampa Electric Company'),
-        'TENNESSEE VALLEY AUTHORITY': (
-            'Tennessee Valley Authority'),
-        'TURLOCK IRRIGATION DISTRICT': (
-            'Turlock Irrigation District'),
-        'HAWAIIAN ELECTRIC CO INC': (
-            'Hawaiian Electric Co Inc'),
-        'WESTERN AREA POWER ADMINISTRATION UGP WEST': (
-            'Western Area Power Administration - Upper Great Plains West'),
-        'AVISTA CORPORATION': (
-            'Avista Corporation'),
-        'SEMINOLE ELECTRIC COOPERATIVE': (
-            'Seminole Electric Cooperative'),
-        'TUCSON ELECTRIC POWER COMPANY': (
-            'Tucson Electric Power'),
-        'WESTERN AREA POWER ADMINISTRATION - DESERT SOUTHWEST REGION': (
-            'Western Area Power Administration - Desert Southwest Region'),
-        'WESTERN AREA POWER ADMINISTRATION - ROCKY MOUNTAIN REGION': (
-            'Western Area Power Administration - Rocky Mountain Region'),
-        'SOUTHEASTERN POWER ADMINISTRATION': (
-            'Southeastern Power Administration'),
-        'NEW HARQUAHALA GENERATING COMPANY, LLC - HGBA': (
-            'New Harquahala Generating Company, LLC'), # fixed for eLCIv2
-        'GRIFFITH ENERGY, LLC': (
-            'Griffith Energy, LLC'),
-        'NATURENER POWER WATCH, LLC (GWA)': (
-            'NaturEner Power Watch, LLC'), # fixed for eLCIv2
-        'GRIDFORCE SOUTH': (
-            'Gridforce South'),
-        'MIDCONTINENT INDEPENDENT TRANSMISSION SYSTEM OPERATOR, INC..': (
-            'Midcontinent Independent System Operator, Inc.'),
-        'ARLINGTON VALLEY, LLC - AVBA': (
-            'Arlington Valley, LLC'), # fixed for eLCIv2
-        'DUKE ENERGY PROGRESS WEST': (
-            'Duke Energy Progress West'),
-        'GRIDFORCE ENERGY MANAGEMENT, LLC': (
-            'Gridforce Energy Management, LLC'),
-        'NATURENER WIND WATCH, LLC': (
-            'NaturEner Wind Watch, LLC'),
-        'SOUTHWEST POWER POOL': (
-            'Southwest Power Pool'),
-    }
-    ba_geo_df['BA_NAME'] = ba_geo_df['NAME'].map(m_dict)
+    ba_geo_df['BA_NAME'] = ba_geo_df['NAME'].map(BA_NAME_MAP)
     return ba_geo_df
 
 
@@ -526,11 +560,34 @@ def download_file(url, filepath):
     filepath : str
         A file path (including the file name) to where the local copy of the
         file should be downloaded.
+
+    Raises
+    ------
+    requests.HTTPError
+        If the server returns an error status (no file is written).
+
+    Notes
+    -----
+    The response is streamed in 1 MiB chunks rather than held in memory.
+    Chunks are written to a temporary file that is moved into place when
+    the download completes, so other processes (e.g., :func:`run_years`
+    workers) never see a partial file; the temporary file is removed if the
+    download fails.
     """
-    r = requests.get(url)
-    if r.ok:
-        with open(filepath, 'wb') as f:
-            f.write(r.content)
+    import requests
+
+    tmp_path = "%s.%d.part" % (filepath, os.getpid())
+    with requests.get(url, stream=True, timeout=60) as r:
+        r.raise_for_status()
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            raise
 
 
 def get_elci_mix(gen_year=2016):
@@ -577,6 +634,7 @@ def get_elci_mix(gen_year=2016):
     return map_ba_codes(df)
 
 
+@functools.lru_cache(maxsize=1)
 def get_ba_map():
     """Return a dictionary of balancing authority names and their abbreviations
 
@@ -585,6 +643,9 @@ def get_ba_map():
     Includes manual additions for GRIS, CEA, and HECO, which are found in
     the HIFLD data and not in the EIA balancing authority list.
 
+    The dictionary is cached, so repeated calls return the same object;
+    do not modify it in place.
+
     Parameters
     ----------
     year : int
@@ -600,9 +661,7 @@ def get_ba_map():
     from electricitylci.utils import read_ba_codes
     ba_codes = read_ba_codes()
 
-    ba_map = {}
-    for idx, row in ba_codes.iterrows():
-        ba_map[row['BA_Name']] = idx
+    ba_map = dict(zip(ba_codes['BA_Name'], ba_codes.index))
 
     # HOTFIX: add missing BA acronyms:
     ba_map['Gridforce South'] = 'GRIS'
@@ -638,7 +697,7 @@ def map_ba_codes(df):
     return df
 
 
-def get_rec(year, rec_path=None, to_save=False):
+def get_rec(year, rec_path=None, to_save=False, columns=None):
     """Create state-level voluntary green power generation (MWh) data frame.
 
     Notes
@@ -669,6 +728,10 @@ def get_rec(year, rec_path=None, to_save=False):
     to_save : bool, optional
         Switch, when set to true, saves a local copy of the Excel workbook to a
         "data" folder, by default False.
+    columns : list, optional
+        Column names to read from the workbook (e.g., ['State', 'Total']),
+        by default None (i.e., all columns). The "Year" column is always
+        read. Reading fewer columns reduces the Excel parsing work.
 
     Returns
     -------
@@ -707,18 +770,57 @@ def get_rec(year, rec_path=None, to_save=False):
             rec_dir = os.path.dirname(rec_path)
             if not os.path.isdir(rec_dir):
                 os.mkdir(rec_dir)
-            download_file(rec_url, rec_path)
+            # Use existing (non-empty) file if available:
+            if not has_file(rec_path):
+                download_file(rec_url, rec_path)
         else:
             rec_path = rec_url
 
+    usecols = None
+    if columns is not None:
+        usecols = tuple(["Year"] + [x for x in columns if x != "Year"])
+
+    df = read_rec_sheet(rec_path, usecols)
+    df = df.loc[df["Year"]==year]
+    return df
+
+
+@functools.lru_cache(maxsize=4)
+def read_rec_sheet(rec_path, usecols=None):
+    """Read the state-level generation sheet of the NREL Green Power Data
+    Excel workbook (all years).
+
+    The parsed sheet is cached for each path and columns, so repeated calls to
+    :func:`get_rec` (e.g., for other years or aggregation methods) do not
+    re-parse the workbook. The faster calamine engine is used when the
+    python-calamine package is installed.
+
+    Parameters
+    ----------
+    rec_path : str
+        A filepath or URL to the referenced Excel workbook.
+    usecols : tuple, optional
+        Column names to read, by default None (i.e., all columns).
+
+    Returns
+    -------
+    pandas.DataFrame
+        A data frame with state-based green electricity generated (MWh) for
+        all years (see :func:`get_rec`). Do not modify in place.
+    """
+    engine = None
+    if python_calamine is not None:
+        engine = "calamine"
+
     # Sheet name, header, and index are based on examining the file.
     df = pd.read_excel(
         rec_path,
         sheet_name="State-Level Generation",
         header=4,
-        index_col=None
+        index_col=None,
+        usecols=None if usecols is None else list(usecols),
+        engine=engine
     )
-    df = df.loc[df["Year"]==year]
     return df
 
 
@@ -747,6 +849,7 @@ def get_ba_plants(year):
     return df
 
 
+@functools.lru_cache(maxsize=None)
 def get_ba_geo(correct_names=False):
     """Create a geospatial data frame for U.S. control areas (i.e., balancing
     authorities).
@@ -756,6 +859,9 @@ def get_ba_geo(correct_names=False):
     than re-download the file. The file name is "control_areas.geojson" and
     is saved in the DATA_DIR directory (e.g., ./data).
 
+    The data frame is cached for each argument value, so repeated calls
+    return the same object; copy it before modifying it in place.
+
     Notes
     -----
     The API referenced in this method links to 2021 control areas, which were
@@ -827,22 +933,23 @@ def get_ba_geo(correct_names=False):
     # Check to make sure data directory exists before attempting download
     if not os.path.isdir(DATA_DIR):
         logging.info("Creating the data directory")
-        os.mkdirs(DATA_DIR)
+        os.makedirs(DATA_DIR, exist_ok=True)
 
-    # Use existing file if available:
-    if not os.path.isfile(ba_path):
+    # Use existing (non-empty) file if available:
+    if not has_file(ba_path):
         logging.info("Downloading the balancing authority geoJSON file")
         download_file(ba_api_url, ba_path)
 
     # Read GeoJSON and correct BA area names (if requested)
     logging.info("Reading balancing authority spatial data")
-    gdf = gpd.read_file(ba_path)
+    gdf = read_geo_file(ba_path)
     if correct_names:
         gdf = correct_ba_geo_names(gdf)
         gdf = map_ba_codes(gdf)
     return gdf
 
 
+@functools.lru_cache(maxsize=None)
 def get_state_geo(year=2020, resolution="500k"):
     """Create geospatial data frame of U.S. state boundaries based on the
     Esri shapefiles provided by the U.S. Census Bureau.
@@ -852,6 +959,9 @@ def get_state_geo(year=2020, resolution="500k"):
     file rather than re-download the file. The file name depends on the year
     provided. The default download location is the DATA_DIR (e.g., ./data).
 
+    The data frame is cached for each year and resolution, so repeated calls
+    return the same object; copy it before modifying it in place.
+
     Parameters
     ----------
     year : int, optional
@@ -895,11 +1005,117 @@ def get_state_geo(year=2020, resolution="500k"):
     shp_url = base_url + state_zip
     # Check to make sure data directory exists before attempting download
     if not os.path.isdir(DATA_DIR):
-        os.mkdirs(DATA_DIR)
-    # Use existing file if available:
-    if not os.path.isfile(zip_path):
+        os.makedirs(DATA_DIR, exist_ok=True)
+    # Use existing (non-empty) file if available:
+    if not has_file(zip_path):
         download_file(shp_url, zip_path)
-    return gpd.read_file(zip_path)
+
+    return read_geo_file(zip_path)
+
+
+def read_geo_file(filepath):
+    """Helper method to read a geospatial file into a geospatial data frame.
+
+    Uses the pyogrio engine when it is installed, which parses the file with
+    GDAL in bulk rather than feature-by-feature, and reads through Arrow when
+    pyarrow is also available.
+
+    When pyarrow is available, the first read is also saved as a GeoParquet
+    file next to the original (same name, ".parquet" extension), which is
+    read instead on subsequent runs as long as it is not older than the
+    original file. Failing to save the GeoParquet file is logged, not
+    raised.
+
+    Parameters
+    ----------
+    filepath : str
+        A file path to a geospatial file (e.g., GeoJSON or zipped shapefile).
+
+    Returns
+    -------
+    geopandas.geodataframe.GeoDataFrame
+        The geospatial data frame read from file.
+    """
+    import geopandas as gpd
+    pq_path = os.path.splitext(filepath)[0] + ".parquet"
+    if pyarrow is not None and has_file(pq_path) and (
+            os.path.getmtime(pq_path) >= os.path.getmtime(filepath)):
+        logging.info("Reading cached GeoParquet, %s" % pq_path)
+        return gpd.read_parquet(pq_path)
+
+    kwargs = {}
+    if pyogrio is not None:
+        kwargs['engine'] = "pyogrio"
+        kwargs['use_arrow'] = pyarrow is not None
+    gdf = gpd.read_file(filepath, **kwargs)
+
+    if pyarrow is not None:
+        # Write to a temporary file and move it into place, so that neither
+        # a failed write nor another process (see :func:`run_years`) leaves
+        # a partial cache that later runs would read.
+        tmp_path = "%s.%d.part" % (pq_path, os.getpid())
+        try:
+            gdf.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, pq_path)
+        except (ImportError, OSError, ValueError,
+                pyarrow.ArrowException) as e:
+            logging.warning(
+                "Failed to write GeoParquet, %s. %s" % (pq_path, e))
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+    return gdf
+
+
+@functools.lru_cache(maxsize=None)
+def get_projected_geo(year, pcs=('esri', 102009)):
+    """Return the balancing authority and state geospatial data frames
+    projected to 2D with their areas (in square kilometers).
+
+    The projected data frames are cached for each year, so repeated calls
+    (e.g., :func:`agg_by_area` over several years) skip both reading and
+    reprojecting the spatial data; copy them before modifying in place.
+    Invalid geometries are made valid after their areas are computed.
+
+    The balancing authority and state data are fetched in two threads, so
+    their first-run downloads (and file reads) overlap.
+
+    Parameters
+    ----------
+    year : int
+        Vintage for U.S. census state-level data (see :func:`get_state_geo`).
+    pcs : tuple, optional
+        The projected coordinate system authority and code, by default
+        North America Lambert Conformal Conic, ('esri', 102009).
+
+    Returns
+    -------
+    tuple
+        A tuple of length two:
+
+        - geopandas.GeoDataFrame: balancing authority areas (see
+          :func:`get_ba_geo`) with new column, 'BAA_KM2'.
+        - geopandas.GeoDataFrame: state boundaries (see
+          :func:`get_state_geo`) with new column, 'ST_KM2'.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        ba_job = pool.submit(get_ba_geo, correct_names=True)
+        us_job = pool.submit(get_state_geo, year)
+        ba_df = ba_job.result().to_crs(pcs)
+        us_df = us_job.result().to_crs(pcs)
+    # Preserve original state and BA areas
+    ba_df['BAA_KM2'] = ba_df['geometry'].area / 10**6
+    us_df['ST_KM2'] = us_df['geometry'].area / 10**6
+
+    # Repair invalid (e.g., self-intersecting) polygons, as geopandas'
+    # overlay did by default, so intersections in agg_by_area do not fail.
+    import shapely
+    for gdf in (ba_df, us_df):
+        geoms = gdf.geometry.to_numpy()
+        is_bad = ~shapely.is_valid(geoms)
+        if is_bad.any():
+            logging.info("Repairing %d invalid geometries" % is_bad.sum())
+            gdf.loc[is_bad, 'geometry'] = shapely.make_valid(geoms[is_bad])
+    return (ba_df, us_df)
 
 
 def get_rec_agg(year, agg_type, rec_path=None, as_series=True):
@@ -952,6 +1168,23 @@ def get_rec_agg(year, agg_type, rec_path=None, as_series=True):
     return r
 
 
+def has_file(filepath):
+    """Helper method to check for an existing, non-empty local file (e.g.,
+    a previous download).
+
+    Parameters
+    ----------
+    filepath : str
+        A file path.
+
+    Returns
+    -------
+    bool
+        Whether the file exists and has a size greater than zero.
+    """
+    return os.path.isfile(filepath) and os.path.getsize(filepath) > 0
+
+
 def load_elci(year):
     """A helper method for dealing with ElectricityLCI and StEWI.
 
@@ -1008,7 +1241,9 @@ def load_elci(year):
 
 
 def linear_search(lst, target):
-    """Backwards search for the value less than or equal to a given value.
+    """Search for the last value less than or equal to a given value.
+
+    Uses a binary search, so the list must be sorted in ascending order.
 
     Parameters
     ----------
@@ -1035,10 +1270,8 @@ def linear_search(lst, target):
     >>> linear_search(NEI_YEARS, 2010)
     -1
     """
-    for i in range(len(lst) - 1, -1, -1):
-        if lst[i] <= target:
-            return i
-    return -1
+    # The right-most insertion point is one past the last value <= target.
+    return bisect.bisect_right(lst, target) - 1
 
 
 def get_stewi_invent_years(year):
@@ -1147,10 +1380,8 @@ def run(rec_path=None, rec_handler='zero', agg_handler='count', gen_yr=2020,
     logging.info("Complete!")
 
     if verbose:
-        m_cols = list(m_df.columns)
-        for _, row in m_df.iterrows():
-            my_str = ",".join([str(row[i]) for i in m_cols])
-            print(my_str)
+        for row in m_df.itertuples(index=False, name=None):
+            print(",".join(map(str, row)))
 
     if to_save:
         logging.info("Writing data to file")
@@ -1161,6 +1392,52 @@ def run(rec_path=None, rec_handler='zero', agg_handler='count', gen_yr=2020,
     return m_df
 
 
+def run_years(years, max_workers=None, log_level=None, **kwargs):
+    """Run the residual grid mix calculation for several generation years,
+    each in its own worker process.
+
+    Because eLCI stores its configuration in memory, each year needs a fresh
+    Python interpreter (see :func:`get_elci_mix`); worker processes are
+    started with the 'spawn' method, so none inherit a loaded eLCI.
+
+    Parameters
+    ----------
+    years : list
+        A list of generation years (e.g., [2016, 2020, 2022]).
+    max_workers : int, optional
+        The maximum number of processes to use, by default None (i.e., the
+        number of processors on the machine, capped at the number of years).
+    log_level : str, optional
+        The logging level for the worker processes (see
+        :func:`set_up_logging`), by default None (i.e., workers do not set up
+        logging; spawned processes do not inherit the parent's handlers).
+    **kwargs
+        Keyword arguments passed to :func:`run` (e.g., rec_path, rec_handler,
+        agg_handler, verbose, to_save).
+
+    Returns
+    -------
+    dict
+        A dictionary of generation years (keys) and their residual grid mix
+        data frames (values; see :func:`run`).
+    """
+    num_workers = min(max_workers or os.cpu_count() or 1, len(years))
+    init_kwargs = {}
+    if log_level is not None:
+        init_kwargs['initializer'] = set_up_logging
+        init_kwargs['initargs'] = (log_level,)
+    r_dict = {}
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max(num_workers, 1),
+            mp_context=multiprocessing.get_context("spawn"),
+            **init_kwargs) as executor:
+        futures = {
+            y: executor.submit(run, gen_yr=y, **kwargs) for y in years}
+        for y, future in futures.items():
+            r_dict[y] = future.result()
+    return r_dict
+
+
 def save_csv(data, fpath, to_zip=False):
     """Save data to CSV file.
 
@@ -1223,21 +1500,104 @@ def save_csv(data, fpath, to_zip=False):
             if not fpath.endswith('.zip'):
                 fpath += ".zip"
             try:
-                data.to_csv(
-                    fpath, encoding="utf-8", compression="zip", index=False)
+                csv_bytes = write_arrow_csv(data)
+                if csv_bytes is None:
+                    data.to_csv(
+                        fpath, encoding="utf-8", compression="zip",
+                        index=False)
+                else:
+                    # Match pandas' archive name (i.e., no '.zip').
+                    with ZipFile(fpath,
+                                 'w',
+                                 compression=ZIP_DEFLATED) as z:
+                        z.writestr(os.path.basename(fpath)[:-4], csv_bytes)
             except:
                 raise
             else:
                 logging.debug("Saved dataframe to zip.")
         else:
             try:
-                data.to_csv(fpath, index=False, encoding="utf-8")
+                csv_bytes = write_arrow_csv(data)
+                if csv_bytes is None:
+                    data.to_csv(fpath, index=False, encoding="utf-8")
+                else:
+                    with open(fpath, 'wb') as f:
+                        f.write(csv_bytes)
             except:
                 raise
             else:
                 logging.debug("Saved dataframe to CSV.")
 
 
+def write_arrow_csv(data):
+    """Helper method to write a data frame to UTF-8 encoded CSV bytes using
+    Arrow's vectorized CSV writer.
+
+    Notes
+    -----
+    Compared to pandas' writer, string values are always quoted and whole
+    floats are written without a trailing '.0'; the values read back the
+    same.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        A data frame (index is not written).
+
+    Returns
+    -------
+    bytes or NoneType
+        The CSV file contents. Returns None if pyarrow is not installed or
+        cannot convert the data frame (e.g., mixed-type object columns), in
+        which case use pandas' writer instead.
+    """
+    if pyarrow is None:
+        return None
+
+    import io
+    from pyarrow import csv as pa_csv
+
+    try:
+        table = pyarrow.Table.from_pandas(data, preserve_index=False)
+    except pyarrow.ArrowException as e:
+        logging.debug("Arrow conversion failed, %s" % e)
+        return None
+
+    buf = io.BytesIO()
+    pa_csv.write_csv(
+        table,
+        buf,
+        write_options=pa_csv.WriteOptions(quoting_style="needed")
+    )
+    return buf.getvalue()
+
+
+def set_up_logging(log_level="INFO"):
+    """Helper method to set up the root logger's console handler and level.
+
+    Used by the command-line tool and as the initializer for the worker
+    processes in :func:`run_years`, so that each process logs alike.
+
+    Parameters
+    ----------
+    log_level : str, optional
+        The logging level (e.g., 'DEBUG', 'INFO', 'WARNING'), by default
+        "INFO".
+    """
+    root_logger = logging.getLogger()
+    root_handler = logging.StreamHandler()
+    rec_format = (
+        "%(asctime)s.%(msecs)03d:%(levelname)s:%(name)s:%(funcName)s:"
+        "%(message)s")
+    formatter = logging.Formatter(rec_format, datefmt='%Y-%m-%d %H:%M:%S')
+    root_handler.setFormatter(formatter)
+    root_logger.addHandler(root_handler)
+    root_logger.setLevel(log_level)
+    # Attempt to hide geos callbacks; thanks Finn (2018)
+    # https://stackoverflow.com/a/51529172
+    logging.getLogger("shapely").setLevel("WARNING")
+
+
 def update_mix(df, rec_path=None, rec_handler='zero', agg_handler='count',
                year=2020):
     """Update a balancing authority generation mix by removing RECs.
@@ -1332,98 +1692,74 @@ def update_mix(df, rec_path=None, rec_handler='zero', agg_handler='count',
     df['Electricity_new'] = df['Electricity']
     df['Gen_Ratio_new'] = df['Generation_Ratio']
 
-    # Define columns used to merge new electricity and generation mix values
-    # to our data frame (referenced in the for-loop below).
-    m_cols = ['Subregion', 'FuelCategory', 'Electricity_new', 'Gen_Ratio_new']
-
     # Get the aggregation series and pair to BA area names
     # NOTE: name corrections for geo BA dataframe should fix any mis-matches
     logging.info("Using %s method" % agg_handler)
     agg_df = get_rec_agg(year, agg_handler, rec_path, as_series=False)
 
-    for baa in df['Subregion'].unique():
-        # ~~~~~~~~~~~~~~~~
-        # NON-GREEN ENERGY
-        # ~~~~~~~~~~~~~~~~
-        # Find all non-green energy sources and set the non-green energy
-        # total (ng) and the non-REC non-green energy total (ngx).
-        ng_df = df.query(
-            "(FuelCategory not in @GREEN_E) & (Subregion == @baa)").copy()
-        ng = 0.0
-        ngx = 0.0
-        if len(ng_df) > 0:
-            ng_df = calc_relative_ratio(ng_df, add_total=True)
-            ng_df.drop(
-                ['Electricity', 'Generation_Ratio'], axis=1, inplace=True)
-            ng = ng_df['Relative_Total'].values[0]
-            ngx = ng
-
-        # ~~~~~~~~~~~~
-        # GREEN ENERGY
-        # ~~~~~~~~~~~~
-        # Find only green energy fuels for the given BA area and initialize
-        # the non-REC green energy total (gx), to zero.
-        g_df = df.query(
-            "(FuelCategory in @GREEN_E) & (Subregion == @baa)").copy()
-        gx = 0.0
-
-        # Skip BA areas with no green energy; nothing to do!
-        if len(g_df) > 0:
-            g_df = calc_relative_ratio(g_df, add_total=True)
-            g_df.drop(['Electricity', 'Generation_Ratio'], axis=1, inplace=True)
-
-            # Merge and keep index; thanks to Wouter Overmeire (2012)
-            # https://stackoverflow.com/a/11982843
-            g_df = g_df.reset_index().merge(
-                agg_df, how='left', on='BA_CODE').set_index("index")
-
-            # Pull values from data frame for green energy total (big_g)
-            # and REC energy total (rec_t) and use them to calculate the
-            # non-REC green energy (gx). NOTE: the relative total and
-            # rec frac columns are constants, so it's safe to pull just
-            # one value from the lot.
-            big_g = g_df['Relative_Total'].values[0]
-            rec_t = g_df['REC_FRAC'].values[0]
-            gx = big_g - rec_t
-
-            # NOTE: due to the categorization of "Green energy," there is a
-            # good chance for negative green generation amounts.
-            # 1. If we keep the negative amounts, when these are added back to
-            #    the generation totals, we can assume that the "mix" or
-            #    "other" fuels compensate ('keep' option); or
-            # 2. We can zero out the negatives ('zero' option).
-
-            # Check for negative green generation
-            if rec_t > big_g:
-                logging.info(
-                    "Negative renewable energy for %s (%0.2e MWh)" % (baa, gx))
-                has_ofe = any(
-                    [i in OVERFLOW_E for i in ng_df['FuelCategory'].values])
-                if rec_handler == 'keep' and has_ofe:
-                    # Pull the "excess" electricity from non-green
-                    gx = 0.0
-                    ngx = ng - (rec_t - big_g)
-                    # Don't let total generation go negative
-                    ngx = max(0.0, ngx)
-                else:
-                    gx = 0.0
-
-        # Calculate non-REC
-        non_rec = gx + ngx
-
-        # Calculate non-REC generation amounts and ratios of each fuel type
-        if len(ng_df) > 0:
-            ng_df['Electricity_new'] = ng_df['Relative_Ratio'] * ngx
-            ng_df['Gen_Ratio_new'] = 0.0
-            if non_rec > 0:
-                ng_df['Gen_Ratio_new'] = ng_df['Electricity_new'] / non_rec
-            df.update(ng_df[m_cols], join='left', overwrite=True)
-        if len(g_df) > 0:
-            g_df['Electricity_new'] = g_df['Relative_Ratio'] * gx
-            g_df['Gen_Ratio_new'] = 0.0
-            if non_rec > 0:
-                g_df['Gen_Ratio_new'] = g_df['Electricity_new'] / non_rec
-            df.update(g_df[m_cols], join='left', overwrite=True)
+    # Split each BA area's fuels into green energy (g) and non-green energy
+    # (ng) groups; per-BA totals are broadcast back to each row.
+    sub = df['Subregion']
+    is_green = df['FuelCategory'].isin(GREEN_E)
+    by_ba = pd.DataFrame({
+        'big_g': df['Electricity'].where(is_green, 0.0),
+        'ng': df['Electricity'].where(~is_green, 0.0),
+        'has_g': is_green,
+        'has_ofe': df['FuelCategory'].isin(OVERFLOW_E),
+    }).groupby(sub, dropna=False)
+
+    # Green energy total (big_g) and non-green energy total (ng) for each
+    # BA area, and whether the area has green and overflow fuel categories
+    big_g = by_ba['big_g'].transform('sum').to_numpy(dtype='float64')
+    ng = by_ba['ng'].transform('sum').to_numpy(dtype='float64')
+    has_g = by_ba['has_g'].transform('any').to_numpy(dtype=bool)
+    has_ofe = by_ba['has_ofe'].transform('any').to_numpy(dtype=bool)
+
+    # REC energy total (rec_t) for each BA area (BA codes map 1:1 to names)
+    rec_t = df['BA_CODE'].map(
+        agg_df.set_index('BA_CODE')['REC_FRAC']
+    ).to_numpy(dtype='float64', na_value=np.nan)
+
+    # Non-REC green energy (gx); BA areas with no green energy keep zero.
+    # NOTE: due to the categorization of "Green energy," there is a
+    # good chance for negative green generation amounts.
+    # 1. If we keep the negative amounts, when these are added back to
+    #    the generation totals, we can assume that the "mix" or
+    #    "other" fuels compensate ('keep' option); or
+    # 2. We can zero out the negatives ('zero' option).
+    gx = np.where(has_g, big_g - rec_t, 0.0)
+    is_neg = has_g & (rec_t > big_g)
+    for baa, neg_gx in pd.Series(gx[is_neg]).groupby(
+            sub[is_neg].to_numpy()).first().items():
+        logging.info(
+            "Negative renewable energy for %s (%0.2e MWh)" % (baa, neg_gx))
+
+    # Non-REC non-green energy (ngx); pull the "excess" electricity from
+    # non-green, but don't let total generation go negative
+    ngx = ng
+    if rec_handler == 'keep':
+        ngx = np.where(
+            is_neg & has_ofe, np.maximum(0.0, ng - (rec_t - big_g)), ng)
+    gx = np.where(is_neg, 0.0, gx)
+
+    # Calculate non-REC
+    non_rec = gx + ngx
+
+    # Calculate non-REC generation amounts and ratios of each fuel type:
+    # each fuel keeps its relative ratio within its (non-)green group.
+    e_vals = df['Electricity'].to_numpy(dtype='float64', na_value=np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel_ratio = e_vals / np.where(is_green, big_g, ng)
+        e_new = rel_ratio * np.where(is_green, gx, ngx)
+        r_new = np.where(non_rec > 0, e_new / non_rec, 0.0)
+
+    # Only overwrite with valid (non-NaN) values for named BA areas (i.e.,
+    # the same as DataFrame.update)
+    is_ba = sub.notna().to_numpy()
+    df['Electricity_new'] = df['Electricity_new'].where(
+        ~(is_ba & ~np.isnan(e_new)), e_new)
+    df['Gen_Ratio_new'] = df['Gen_Ratio_new'].where(
+        ~(is_ba & ~np.isnan(r_new)), r_new)
     return df
 
 
@@ -1431,19 +1767,6 @@ def update_mix(df, rec_path=None, rec_handler='zero', agg_handler='count',
 # MAIN
 ##############################################################################
 if __name__ == '__main__':
-    # Set up logger
-    root_logger = logging.getLogger()
-    root_handler = logging.StreamHandler()
-    rec_format = (
-        "%(asctime)s.%(msecs)03d:%(levelname)s:%(name)s:%(funcName)s:"
-        "%(message)s")
-    formatter = logging.Formatter(rec_format, datefmt='%Y-%m-%d %H:%M:%S')
-    root_handler.setFormatter(formatter)
-    root_logger.addHandler(root_handler)
-    # Attempt to hide geos callbacks; thanks Finn (2018)
-    # https://stackoverflow.com/a/51529172
-    logging.getLogger("shapely").setLevel("WARNING")
-
     # Add command-line argument handling to turn this into a tool.
     p = argparse.ArgumentParser(
         description="The residual grid mix Python tool.")
@@ -1459,8 +1782,10 @@ if __name__ == '__main__':
         choices=['area', 'count'],
         help="method for aggregating REC generation from states to BA areas")
     p.add_argument(
-        "-y", "--year", type=int, default=2020,
-        help="generation year, defaults to 2020")
+        "-y", "--year", type=int, nargs="+", default=[2020],
+        help=(
+            "generation year(s), defaults to 2020; multiple years are run "
+            "in parallel worker processes"))
     p.add_argument(
         "-v", "--verbose", action='store_true',
         help="print results to console")
@@ -1476,15 +1801,26 @@ if __name__ == '__main__':
     args = p.parse_args()
 
     # Manage command-line arguments
-    root_logger.setLevel(args.log_level)
+    set_up_logging(args.log_level)
     r_file = args.rec_file
     if r_file and not os.path.isfile(r_file):
         r_file = None
-    mix_df = run(
-        r_file,
-        rec_handler=args.rec_method,
-        agg_handler=args.agg_method,
-        gen_yr=args.year,
-        verbose=args.verbose,
-        to_save=args.save
-    )
+    if len(args.year) == 1:
+        mix_df = run(
+            r_file,
+            rec_handler=args.rec_method,
+            agg_handler=args.agg_method,
+            gen_yr=args.year[0],
+            verbose=args.verbose,
+            to_save=args.save
+        )
+    else:
+        mix_dfs = run_years(
+            args.year,
+            log_level=args.log_level,
+            rec_path=r_file,
+            rec_handler=args.rec_method,
+            agg_handler=args.agg_method,
+            verbose=args.verbose,
+            to_save=args.save
+        )